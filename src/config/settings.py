@@ -73,7 +73,6 @@ class FairPriceConfig:
             "timeout": 30,
             "max_retries": 3,
             "retry_delay": 2,  # seconds
-            "request_delay": 1,  # seconds between requests (be respectful)
         }
     
     @property
@@ -279,6 +278,23 @@ class FairPriceConfig:
             'preco_total': 'float64'
         }
     
+    @property
+    def raw_dtypes(self) -> Dict[str, str]:
+        """Data types for raw CSV columns, read as-is instead of being inferred"""
+        return {
+            # Identifiers keep their leading zeros
+            'CNPJ_Fabricante': 'string',
+            'CNPJ_Fornecedor': 'string',
+            'CNPJ_Instituição': 'string',
+            
+            # Brazilian-formatted prices are parsed by the cleaners
+            'Preço_Unitário': 'string',
+            'Preço_Total': 'string',
+            
+            # Low-cardinality text
+            'UF': 'category'
+        }
+    
     # =============================================================================
     # BRAZILIAN-SPECIFIC VALIDATION RULES
     # =============================================================================
@@ -12,6 +12,8 @@ from typing import Dict, List, Any, Tuple, Optional
 import time
 from datetime import datetime
 
+from utils.files import list_csv_files
+
 
 class HealthDataConsolidator:
     """
@@ -43,7 +45,7 @@ class HealthDataConsolidator:
         """
         self.logger.info(f"📂 Loading standardized files from {input_dir}")
         
-        csv_files = list(input_dir.glob("*.csv"))
+        csv_files = list_csv_files(input_dir)
         if not csv_files:
             raise ValueError(f"No CSV files found in {input_dir}")
         
@@ -304,30 +306,30 @@ class HealthDataConsolidator:
         """
         self.logger.info("✅ Validating consolidated dataset...")
         
+        # One null-count pass shared by every completeness metric
+        null_counts = df.isna().sum()
+        
         validation_report = {
             'total_rows': len(df),
             'total_columns': len(df.columns),
             'memory_usage_mb': df.memory_usage(deep=True).sum() / (1024 * 1024),
             'year_distribution': df['ano'].value_counts().to_dict() if 'ano' in df.columns else {},
-            'completeness_by_column': {},
+            'completeness_by_column': ((1 - null_counts / len(df)) * 100).to_dict(),
             'data_types': df.dtypes.to_dict(),
             'quality_summary': {}
         }
         
-        # Calculate completeness
-        for col in df.columns:
-            completeness = (1 - df[col].isnull().sum() / len(df)) * 100
-            validation_report['completeness_by_column'][col] = completeness
-        
         overall_completeness = sum(validation_report['completeness_by_column'].values()) / len(df.columns)
         validation_report['overall_completeness'] = overall_completeness
         
         # Basic quality checks
+        # Full rows are hashed once for both duplicate metrics
+        duplicate_count = int(df.duplicated().sum())
         validation_report['quality_summary'] = {
-            'has_duplicates': df.duplicated().any(),
-            'duplicate_count': df.duplicated().sum(),
-            'has_null_values': df.isnull().any().any(),
-            'null_percentage': df.isnull().sum().sum() / (len(df) * len(df.columns)) * 100
+            'has_duplicates': duplicate_count > 0,
+            'duplicate_count': duplicate_count,
+            'has_null_values': null_counts.any(),
+            'null_percentage': null_counts.sum() / (len(df) * len(df.columns)) * 100
         }
         
         self.logger.info(f"   📊 Final dataset: {validation_report['total_rows']:,} rows × {validation_report['total_columns']} columns")
@@ -17,9 +17,15 @@ from pathlib import Path
 
 # Import our configuration and logging
 from config.settings import get_config
+from standardization.cleaners import build_encoding_fix_pattern
+from utils.files import list_csv_files, sniff_csv_format
 from utils.logger import get_exploration_logger, log_data_operation
 
 
+# Characters replaced by '_' in cleaned column names (anything but letters, digits, '_' and '-')
+COLUMN_NAME_INVALID_RE = re.compile(r'[^\w-]')
+
+
 class BrazilianHealthDataAnalyzer:
     """
     Comprehensive analyzer for Brazilian Health Economics CSV data
@@ -36,7 +42,7 @@ class BrazilianHealthDataAnalyzer:
         self.logger = get_exploration_logger()
         self.logger.info("🔍 Brazilian Health Data Analyzer initialized")
     
-    @log_data_operation(get_exploration_logger(), "Schema analysis")
+    @log_data_operation(get_exploration_logger, "Schema analysis")
     def analyze_schema(self, df: pd.DataFrame, filename: str) -> Dict[str, Any]:
         """
         Comprehensive schema analysis of a DataFrame
@@ -65,7 +71,7 @@ class BrazilianHealthDataAnalyzer:
         
         return schema_info
     
-    @log_data_operation(get_exploration_logger(), "Data quality assessment") 
+    @log_data_operation(get_exploration_logger, "Data quality assessment") 
     def analyze_data_quality(self, df: pd.DataFrame, filename: str) -> Dict[str, Any]:
         """
         Comprehensive data quality analysis
@@ -96,7 +102,7 @@ class BrazilianHealthDataAnalyzer:
         
         return quality_info
     
-    @log_data_operation(get_exploration_logger(), "Content pattern analysis")
+    @log_data_operation(get_exploration_logger, "Content pattern analysis")
     def analyze_content_patterns(self, df: pd.DataFrame, filename: str) -> Dict[str, Any]:
         """
         Analyze content patterns and value distributions
@@ -130,7 +136,7 @@ class BrazilianHealthDataAnalyzer:
         
         return content_info
     
-    @log_data_operation(get_exploration_logger(), "Brazilian-specific pattern analysis")
+    @log_data_operation(get_exploration_logger, "Brazilian-specific pattern analysis")
     def analyze_brazilian_specifics(self, df: pd.DataFrame, filename: str) -> Dict[str, Any]:
         """
         Analyze Brazilian-specific data patterns
@@ -518,6 +524,8 @@ class CSVLoaderAndAnalyzer:
         self.config = get_config()
         self.logger = get_exploration_logger()
         self.analyzer = BrazilianHealthDataAnalyzer()
+        encoding_fixes = self.config.encoding_fixes
+        self.encoding_fix_pattern = build_encoding_fix_pattern(encoding_fixes) if encoding_fixes else None
     
     def load_csv_robust(self, csv_path: str) -> pd.DataFrame:
         """
@@ -532,6 +540,24 @@ class CSVLoaderAndAnalyzer:
         csv_path = Path(csv_path)
         self.logger.info(f"📂 Loading CSV: {csv_path.name}")
         
+        # Sniff encoding and separator once, then parse a single time with the C engine
+        try:
+            encoding, sep = sniff_csv_format(csv_path)
+            try:
+                df = pd.read_csv(csv_path, encoding=encoding, sep=sep, on_bad_lines='skip', engine='c')
+            except UnicodeDecodeError:
+                # Invalid UTF-8 past the sniffed sample
+                encoding = 'latin-1'
+                df = pd.read_csv(csv_path, encoding=encoding, sep=sep, on_bad_lines='skip', engine='c')
+            
+            if df.shape[1] > 5:  # Reasonable column count
+                self.logger.info(f"   ✅ Loaded with {encoding} + '{sep}': {df.shape[0]:,} rows × {df.shape[1]} columns")
+                return self._clean_encoding_artifacts(df)
+            
+            self.logger.debug(f"   Sniffed {encoding} + '{sep}' gave only {df.shape[1]} columns")
+        except Exception as e:
+            self.logger.debug(f"   Sniffing failed: {str(e)}")
+        
         # Common encodings for Brazilian data
         encodings_to_try = ['utf-8', 'latin-1', 'iso-8859-1', 'windows-1252', 'cp1252']
         separators_to_try = [',', ';', '\t']
@@ -663,16 +689,15 @@ class CSVLoaderAndAnalyzer:
         encoding_fixes = self.config.encoding_fixes
         
         result = col_name
-        for old, new in encoding_fixes.items():
-            result = result.replace(old, new)
+        if self.encoding_fix_pattern is not None:
+            result = self.encoding_fix_pattern.sub(lambda match: encoding_fixes[match.group(0)], result)
         
         # Remove problematic characters and normalize
-        result = ''.join(c if c.isalnum() or c in '_-' else '_' for c in result)
-        result = result.strip('_')
+        result = COLUMN_NAME_INVALID_RE.sub('_', result).strip('_')
         
         return result
     
-    @log_data_operation(get_exploration_logger(), "Complete CSV exploration")
+    @log_data_operation(get_exploration_logger, "Complete CSV exploration")
     def explore_csv_file(self, csv_path: str) -> Dict[str, Any]:
         """
         Complete workflow: load CSV, analyze, and return comprehensive analysis
@@ -729,7 +754,7 @@ def explore_all_health_csvs(csv_directory: Optional[str] = None) -> List[Dict[st
     
     logger.info(f"🔍 Exploring all CSV files in: {csv_directory}")
     
-    csv_files = list(csv_directory.glob("*.csv"))
+    csv_files = list_csv_files(csv_directory)
     if not csv_files:
         logger.warning(f"⚠️  No CSV files found in {csv_directory}")
         return []
@@ -759,7 +784,7 @@ if __name__ == "__main__":
     config = get_config()
     
     # Check if we have any CSV files to explore
-    csv_files = list(config.raw_data_dir.glob("*.csv"))
+    csv_files = list_csv_files(config.raw_data_dir)
     
     if csv_files:
         print(f"📋 Found {len(csv_files)} CSV files in {config.raw_data_dir}")
@@ -38,7 +38,7 @@ class ExplorationReportGenerator:
         self.logger.info(f"📊 Exploration Report Generator initialized")
         self.logger.info(f"📁 Reports directory: {self.reports_dir}")
     
-    @log_data_operation(get_exploration_logger(), "Individual file report generation")
+    @log_data_operation(get_exploration_logger, "Individual file report generation")
     def generate_file_report(self, analysis: Dict[str, Any], output_filename: Optional[str] = None) -> Path:
         """
         Generate a comprehensive text report for a single file analysis
@@ -69,7 +69,7 @@ class ExplorationReportGenerator:
         self.logger.info(f"📄 Individual report saved: {output_path.name}")
         return output_path
     
-    @log_data_operation(get_exploration_logger(), "Cross-file comparison report generation")
+    @log_data_operation(get_exploration_logger, "Cross-file comparison report generation")
     def generate_comparison_report(self, analyses: List[Dict[str, Any]], output_filename: Optional[str] = None) -> Path:
         """
         Generate a cross-file comparison report for multiple analyses
@@ -11,19 +11,76 @@ Target: https://opendatasus.saude.gov.br/dataset/bps
 import requests
 from bs4 import BeautifulSoup
 import re
-import time
 import zipfile
-import io
+import os
+import sys
+import shutil
+import struct
+import tempfile
+import zlib
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import json
+import hashlib
+import logging
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import xxhash
+except ImportError:  # Optional: fall back to hashlib for tail hashes
+    xxhash = None
+
+try:
+    from lxml import html as lxml_html  # C-backed parser, much faster than html.parser
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional: BeautifulSoup is used for link extraction instead
+    LexborHTMLParser = None
 
 # Import our configuration and logging
 from config.settings import get_config
 from utils.logger import get_extraction_logger, log_data_operation, log_progress
 
 
+# Buffer size for copying/inflating CSV data to disk
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Number of trailing bytes hashed to detect truncated/corrupted CSV files
+TAIL_HASH_BYTES = 64 * 1024
+
+# Concurrent HEAD requests when validating URLs; stays below the adapter's
+# connection pool size so every thread reuses a keep-alive socket
+HEAD_MAX_WORKERS = 8
+
+# ZIP archives larger than this are spooled to a temporary file instead of RAM
+ZIP_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# S3 BPS CSV download link, capturing the year (e.g. .../BPS/csv/2024.csv.zip)
+S3_BPS_CSV_RE = re.compile(r'https?://s3\.sa-east-1\.amazonaws\.com/[^"\']*/BPS/csv/(\d{4})\.csv\.zip')
+
+# Any zipped CSV hosted on the OpenDataSUS S3 bucket
+S3_CSV_ZIP_RE = re.compile(r's3\.sa-east-1\.amazonaws\.com/.*\.csv\.zip')
+
+# Four-digit year in link text, e.g. "Banco de Preços em Saúde - 2024"
+YEAR_IN_TEXT_RE = re.compile(r'(?<!\d)(20\d{2})(?!\d)')
+
+
+@dataclass(slots=True)
+class DownloadResult:
+    """Extracted CSV file and its size, as measured right after download"""
+    path: Path
+    size_bytes: int
+
+
 class OpenDataSUSExtractor:
     """
     Web scraper for OpenDataSUS BPS (Banco de Preços em Saúde) CSV files
@@ -50,13 +107,32 @@ class OpenDataSUSExtractor:
         self.session = requests.Session()
         self.session.headers.update(self.opendatasus_config["headers"])
         
+        # Size the connection pool so concurrent HEADs and the following GETs share sockets,
+        # and let the adapter retry transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_maxsize=max(10, len(self.config.target_years)),
+            max_retries=Retry(
+                total=self.opendatasus_config["max_retries"],
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # ETag/Content-Length per year, collected by the HEAD prefetch
+        self._remote_metadata: Dict[int, Dict[str, Optional[str]]] = {}
+        
+        # Links found by scraping the BPS page, reused across discovery calls
+        self._discovered_links: Dict[int, str] = {}
+        
         self.logger.info(f"🏥 OpenDataSUS Extractor initialized")
         self.logger.info(f"📁 Output directory: {self.output_dir}")
         self.logger.info(f"🎯 Target years: {self.config.target_years}")
     
     def validate_connection(self) -> bool:
         """
-        Validate connection to OpenDataSUS portal
+        Validate connection to OpenDataSUS portal with a HEAD request
         
         Returns:
             True if connection successful, False otherwise
@@ -64,14 +140,15 @@ class OpenDataSUSExtractor:
         try:
             self.logger.info("🔍 Validating connection to OpenDataSUS...")
             
-            response = self.session.get(
+            response = self.session.head(
                 self.bps_url, 
+                allow_redirects=True,
                 timeout=self.opendatasus_config["timeout"]
             )
             response.raise_for_status()
             
-            # Check if we got a valid HTML page
-            if "dataset/bps" in response.url and len(response.content) > 1000:
+            # Check that we were not redirected away from the dataset page
+            if "dataset/bps" in response.url:
                 self.logger.info("✅ Connection to OpenDataSUS validated successfully")
                 return True
             else:
@@ -82,13 +159,69 @@ class OpenDataSUSExtractor:
             self.logger.error(f"❌ Connection validation failed: {str(e)}")
             return False
     
-    @log_data_operation(get_extraction_logger(), "CSV download links discovery")
-    def discover_csv_download_links(self, years: Optional[List[int]] = None) -> Dict[int, str]:
+    def _fetch_and_discover(self, years: List[int]) -> Dict[int, str]:
         """
-        Scrape the BPS page to discover CSV download links
+        Validate the connection and discover download links with as few requests as possible
+        
+        The known S3 URLs are probed with HEAD requests first. When they
+        resolve every year, those responses prove the portal is reachable and
+        the BPS page is never requested. Otherwise the page is fetched once for
+        the remaining years, and the response that validates the connection is
+        handed to link discovery instead of being downloaded again.
+        
+        Args:
+            years: Years to look for
+            
+        Returns:
+            Dictionary mapping year to download URL
+        """
+        self.logger.info("🔍 Validating connection to OpenDataSUS...")
+        self.logger.info("🔧 Checking known S3 URL pattern...")
+        
+        direct_urls = self._construct_direct_urls(years)
+        validation_results = self._prefetch_url_metadata(direct_urls)
+        csv_links = {year: url for year, url in direct_urls.items() if validation_results[year]}
+        for year, url in csv_links.items():
+            self.logger.info(f"   📅 Confirmed {year}: {url}")
+        
+        missing_years = [year for year in years if year not in csv_links]
+        if not missing_years:
+            self.logger.info("✅ Connection to OpenDataSUS validated successfully")
+            self.logger.info(f"✅ Discovered {len(csv_links)} CSV download links")
+            return csv_links
+        
+        try:
+            response = self._request_bps_page(missing_years)
+            
+            # 304 means our cached copy of the page is still current
+            if response.status_code != 304:
+                response.raise_for_status()
+                if "dataset/bps" not in response.url or len(response.content) <= 1000:
+                    raise Exception(f"Invalid response from OpenDataSUS: {response.url}")
+                
+        except Exception as e:
+            self.logger.error(f"❌ Connection validation failed: {str(e)}")
+            raise Exception("Cannot connect to OpenDataSUS portal") from e
+        
+        self.logger.info("✅ Connection to OpenDataSUS validated successfully")
+        csv_links.update(self.discover_csv_download_links(
+            missing_years, prefer_direct_urls=False, bps_response=response
+        ))
+        return csv_links
+    
+    @log_data_operation(get_extraction_logger, "CSV download links discovery")
+    def discover_csv_download_links(self, years: Optional[List[int]] = None,
+                                    prefer_direct_urls: bool = True,
+                                    bps_response: Optional[requests.Response] = None) -> Dict[int, str]:
+        """
+        Discover CSV download links for the requested years
         
         Args:
             years: Years to look for (default: from config)
+            prefer_direct_urls: Confirm the known S3 URL pattern with HEAD requests
+                first and only scrape the BPS page for years that fail
+            bps_response: Already fetched BPS page response to scrape instead of
+                requesting the page again
             
         Returns:
             Dictionary mapping year to download URL
@@ -96,56 +229,155 @@ class OpenDataSUSExtractor:
         if years is None:
             years = self.config.target_years
         
+        csv_links = {}
+        
+        # Strategy 0: Confirm the known S3 URL pattern without touching the BPS page
+        if prefer_direct_urls:
+            self.logger.info("🔧 Checking known S3 URL pattern...")
+            direct_urls = self._construct_direct_urls(years)
+            validation_results = self._prefetch_url_metadata(direct_urls)
+            
+            for year, url in direct_urls.items():
+                if validation_results[year]:
+                    csv_links[year] = url
+                    self.logger.info(f"   📅 Confirmed {year}: {url}")
+            
+            if len(csv_links) == len(years):
+                self.logger.info(f"✅ Discovered {len(csv_links)} CSV download links")
+                return csv_links
+        
+        missing_years = [year for year in years if year not in csv_links]
+        csv_links.update(self._scrape_csv_links(missing_years, bps_response))
+        
+        # Strategy 3: Use known S3 URL pattern (fallback from your working code)
+        if len(csv_links) < len(years):
+            missing_years = [year for year in years if year not in csv_links]
+            self.logger.warning(f"⚠️  Missing links for years: {missing_years}")
+            self.logger.info("🔧 Using known S3 URL pattern...")
+            
+            for year, fallback_url in self._construct_direct_urls(missing_years).items():
+                csv_links[year] = fallback_url
+                self.logger.info(f"   🔨 Constructed {year}: {fallback_url}")
+        
+        self.logger.info(f"✅ Discovered {len(csv_links)} CSV download links")
+        return csv_links
+    
+    def _construct_direct_urls(self, years: List[int]) -> Dict[int, str]:
+        """
+        Build S3 download URLs from the known BPS bucket pattern
+        
+        Args:
+            years: Years to build URLs for
+            
+        Returns:
+            Dictionary mapping year to constructed URL
+        """
+        # This is the pattern that worked in your extraction notebook
+        s3_base = self.config.csv_patterns["s3_base"]
+        return {year: f"{s3_base}{year}.csv.zip" for year in years}
+    
+    def _request_bps_page(self, years: List[int]) -> requests.Response:
+        """
+        GET the BPS page, conditionally if the cached index covers the years
+        
+        Args:
+            years: Years the caller is looking for
+            
+        Returns:
+            HTTP response (304 if the cached index is still current)
+        """
+        # Revalidate the cached index only if it covered all requested years
+        cached_index = self._load_bps_index()
+        conditional_headers = {}
+        if cached_index and set(years) <= set(cached_index.get('searched_years', [])):
+            if cached_index.get('etag'):
+                conditional_headers['If-None-Match'] = cached_index['etag']
+            if cached_index.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = cached_index['last_modified']
+        
+        return self.session.get(
+            self.bps_url, 
+            headers=conditional_headers,
+            timeout=self.opendatasus_config["timeout"]
+        )
+    
+    def _scrape_csv_links(self, years: List[int],
+                          response: Optional[requests.Response] = None) -> Dict[int, str]:
+        """
+        Scrape the BPS page to discover CSV download links
+        
+        Results are cached in self._discovered_links so repeated calls for
+        already resolved years do not fetch and parse the page again. Across
+        runs, the page is requested conditionally (ETag/Last-Modified) and a
+        304 response reuses the links stored in .bps_index.json without
+        transferring or parsing the HTML.
+        
+        Args:
+            years: Years to look for
+            response: BPS page response to reuse (fetched here if not given)
+            
+        Returns:
+            Dictionary mapping year to download URL (only years that were found)
+        """
+        if all(year in self._discovered_links for year in years):
+            return {year: self._discovered_links[year] for year in years}
+        
         self.logger.info(f"🔍 Scraping BPS page for CSV links...")
         
         try:
             # Get the main BPS dataset page
-            response = self.session.get(
-                self.bps_url, 
-                timeout=self.opendatasus_config["timeout"]
-            )
-            response.raise_for_status()
+            if response is None:
+                response = self._request_bps_page(years)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if response.status_code == 304:
+                self.logger.info("📋 BPS page not modified, using cached links")
+                cached_index = self._load_bps_index()
+                cached_links = {int(year): url for year, url in cached_index['csv_links'].items()}
+                csv_links = {year: cached_links[year] for year in years if year in cached_links}
+                self._discovered_links.update(csv_links)
+                return csv_links
+            
+            response.raise_for_status()
             
             # Find CSV download links using multiple strategies
             csv_links = {}
-            all_links = soup.find_all('a', href=True)
+            all_links = self._extract_links(response.content)
             
             self.logger.info(f"📋 Found {len(all_links)} total links on page")
             
+            years_set = set(years)
+            
             # Strategy 1: Look for direct S3 CSV download links
-            for link in all_links:
-                href = link.get('href')
+            for href, _ in all_links:
                 
-                # Check for S3 CSV links
-                if (href and 
-                    's3.sa-east-1.amazonaws.com' in href and 
-                    '/BPS/csv/' in href and 
-                    '.csv.zip' in href):
-                    
-                    # Extract year from URL
-                    year_match = re.search(self.config.csv_patterns["year_pattern"], href)
-                    if year_match:
-                        year = int(year_match.group(1))
-                        if year in years:
-                            csv_links[year] = href
-                            self.logger.info(f"   📅 Found {year}: {href}")
+                # Check for S3 CSV links and extract the year in the same match
+                s3_match = S3_BPS_CSV_RE.search(href) if href else None
+                if s3_match:
+                    year = int(s3_match.group(1))
+                    if year in years_set:
+                        csv_links[year] = href
+                        self.logger.info(f"   📅 Found {year}: {href}")
+                        
+                        # Stop scanning once every requested year is resolved
+                        if len(csv_links) >= len(years_set):
+                            break
             
             # Strategy 2: Look for year-specific dataset links and follow them
-            if len(csv_links) < len(years):
+            if len(csv_links) < len(years_set):
                 self.logger.info("🔍 Searching for year-specific dataset links...")
                 
                 # Find links that contain years in text
-                for link in all_links:
-                    link_text = link.get_text(strip=True)
-                    href = link.get('href')
+                for href, link_text in all_links:
+                    if len(csv_links) >= len(years_set):
+                        break
                     
                     # Look for patterns like "Banco de Preço de Saúde - 2024"
-                    for year in years:
-                        if (str(year) in link_text and 
-                            ('banco' in link_text.lower() or 'bps' in link_text.lower() or 'preço' in link_text.lower()) and
-                            year not in csv_links):
+                    text_lower = link_text.lower()
+                    if 'banco' not in text_lower and 'bps' not in text_lower and 'preço' not in text_lower:
+                        continue
+                    
+                    for year in map(int, YEAR_IN_TEXT_RE.findall(link_text)):
+                        if year in years_set and year not in csv_links:
                             
                             # Try to find the actual CSV download from this page
                             if href and not href.startswith('http'):
@@ -155,26 +387,88 @@ class OpenDataSUSExtractor:
                             if csv_url:
                                 csv_links[year] = csv_url
                                 self.logger.info(f"   📅 Found {year} via dataset page: {csv_url}")
+                                
+                                if len(csv_links) >= len(years_set):
+                                    break
             
-            # Strategy 3: Use known S3 URL pattern (fallback from your working code)
-            if len(csv_links) < len(years):
-                missing_years = [year for year in years if year not in csv_links]
-                self.logger.warning(f"⚠️  Missing links for years: {missing_years}")
-                self.logger.info("🔧 Using known S3 URL pattern...")
-                
-                for year in missing_years:
-                    # This is the pattern that worked in your extraction notebook
-                    fallback_url = f"https://s3.sa-east-1.amazonaws.com/ckan.saude.gov.br/BPS/csv/{year}.csv.zip"
-                    csv_links[year] = fallback_url
-                    self.logger.info(f"   🔨 Constructed {year}: {fallback_url}")
-            
-            self.logger.info(f"✅ Discovered {len(csv_links)} CSV download links")
+            self._discovered_links.update(csv_links)
+            self._save_bps_index(response, years, csv_links)
             return csv_links
             
         except Exception as e:
             self.logger.error(f"❌ Failed to discover CSV links: {str(e)}")
             raise
     
+    def _bps_index_path(self) -> Path:
+        """File caching the links scraped from the BPS page with its validators"""
+        return self.output_dir / '.bps_index.json'
+    
+    def _load_bps_index(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the cached BPS scrape result
+        
+        Returns:
+            Cached index dictionary or None if missing/unreadable
+        """
+        try:
+            with open(self._bps_index_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_bps_index(self, response: requests.Response, years: List[int], csv_links: Dict[int, str]):
+        """
+        Save scraped links together with the page's ETag/Last-Modified
+        
+        Args:
+            response: Response of the BPS page request
+            years: Years that were searched for
+            csv_links: Links found for those years
+        """
+        index = {
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'searched_years': list(years),
+            'csv_links': {str(year): url for year, url in csv_links.items()}
+        }
+        
+        if not index['etag'] and not index['last_modified']:
+            return  # nothing to revalidate against
+        
+        try:
+            with open(self._bps_index_path(), 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+        except OSError as e:
+            self.logger.debug(f"   ⚠️  Could not save BPS index: {str(e)}")
+    
+    @staticmethod
+    def _extract_links(content: bytes) -> List[Tuple[Optional[str], str]]:
+        """
+        Extract every <a href> from an HTML page
+        
+        Uses selectolax (lexbor backend) when installed, otherwise a single
+        lxml XPath query; both are much faster than building a BeautifulSoup
+        tree just to read anchors, which remains the last fallback.
+        
+        Args:
+            content: Raw HTML page content
+            
+        Returns:
+            List of (href, link text) tuples in document order
+        """
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(content)
+            return [(node.attributes.get('href'), node.text(strip=True)) for node in tree.css('a[href]')]
+        
+        if lxml_html is not None:
+            if not content.strip():
+                return []  # lxml refuses to parse an empty document
+            tree = lxml_html.fromstring(content)
+            return [(link.get('href'), link.text_content().strip()) for link in tree.xpath('//a[@href]')]
+        
+        soup = BeautifulSoup(content, HTML_PARSER)
+        return [(link.get('href'), link.get_text(strip=True)) for link in soup.find_all('a', href=True)]
+    
     def _find_csv_from_dataset_page(self, dataset_url: str, year: int) -> Optional[str]:
         """
         Follow a dataset page link to find the actual CSV download URL
@@ -195,16 +489,10 @@ class OpenDataSUSExtractor:
             response = self.session.get(dataset_url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             # Look for CSV download links on this page
-            for link in soup.find_all('a', href=True):
-                href = link.get('href')
+            for href, _ in self._extract_links(response.content):
                 
-                if (href and 
-                    's3.sa-east-1.amazonaws.com' in href and 
-                    '.csv.zip' in href and 
-                    str(year) in href):
+                if href and S3_CSV_ZIP_RE.search(href) and str(year) in href:
                     return href
             
             return None
@@ -235,6 +523,11 @@ class OpenDataSUSExtractor:
                 
                 self.logger.debug(f"   📊 {year} URL validation: {response.status_code}, "
                                 f"type: {content_type}, size: {content_length}")
+                self._remote_metadata[year] = {
+                    'url': url,
+                    'etag': response.headers.get('etag'),
+                    'content_length': content_length
+                }
                 return True
             else:
                 self.logger.warning(f"   ⚠️  {year} URL returned status: {response.status_code}")
@@ -244,7 +537,113 @@ class OpenDataSUSExtractor:
             self.logger.warning(f"   ❌ {year} URL validation failed: {str(e)}")
             return False
     
-    @log_data_operation(get_extraction_logger(), "CSV file download and extraction")
+    def _prefetch_url_metadata(self, csv_links: Dict[int, str]) -> Dict[int, bool]:
+        """
+        Validate all CSV URLs with concurrent HEAD requests
+        
+        Primes the connection pool for the subsequent GETs and records
+        ETag/Content-Length for every year before any body is transferred.
+        URLs already validated by an earlier call are not requested again.
+        
+        Args:
+            csv_links: Dictionary mapping year to download URL
+            
+        Returns:
+            Dictionary mapping year to validation result
+        """
+        results = {
+            year: True for year, url in csv_links.items()
+            if self._remote_metadata.get(year, {}).get('url') == url
+        }
+        pending = {year: url for year, url in csv_links.items() if year not in results}
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(HEAD_MAX_WORKERS, len(pending))) as executor:
+                futures = {
+                    year: executor.submit(self._validate_csv_url, year, url)
+                    for year, url in pending.items()
+                }
+                results.update({year: future.result() for year, future in futures.items()})
+        
+        return results
+    
+    def _etag_path(self, output_path: Path) -> Path:
+        """Sidecar file storing the ETag of the ZIP a CSV was extracted from"""
+        return output_path.with_name(output_path.name + '.etag')
+    
+    def _tail_hash_path(self, output_path: Path) -> Path:
+        """Sidecar file storing the hash of the last bytes of an extracted CSV"""
+        return output_path.with_name(output_path.name + '.tail-hash')
+    
+    def _compute_tail_hash(self, file_path: Path, algorithm: Optional[str] = None) -> Optional[str]:
+        """
+        Hash the last 64KB of a file
+        
+        Args:
+            file_path: File to hash
+            algorithm: 'xxh3_64' or 'blake2b' (default: xxh3_64 when xxhash is installed)
+            
+        Returns:
+            Hash as '<algorithm>:<hexdigest>', or None if the algorithm is unavailable
+        """
+        if algorithm is None:
+            algorithm = 'xxh3_64' if xxhash is not None else 'blake2b'
+        
+        with open(file_path, 'rb') as f:
+            f.seek(max(0, f.seek(0, os.SEEK_END) - TAIL_HASH_BYTES))
+            tail = f.read()
+        
+        if algorithm == 'xxh3_64':
+            if xxhash is None:
+                return None
+            return f"{algorithm}:{xxhash.xxh3_64_hexdigest(tail)}"
+        
+        return f"blake2b:{hashlib.blake2b(tail, digest_size=8).hexdigest()}"
+    
+    def _is_existing_file_valid(self, year: int, output_path: Path,
+                                stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Check whether an already extracted CSV can be reused
+        
+        Args:
+            year: Year of the CSV
+            output_path: Path of the extracted CSV
+            stat: Stat result already known for output_path (avoids another syscall)
+            
+        Returns:
+            True if the file is large enough and matches the remote ETag or,
+            when no ETag is available, its stored tail hash; files without
+            either sidecar were never verified and are not reused
+        """
+        if stat is None:
+            try:
+                stat = output_path.stat()
+            except FileNotFoundError:
+                return False
+        
+        if stat.st_size <= 100000:  # > 100KB
+            return False
+        
+        remote_etag = self._remote_metadata.get(year, {}).get('etag')
+        etag_path = self._etag_path(output_path)
+        if remote_etag and etag_path.exists():
+            return etag_path.read_text(encoding='utf-8').strip() == remote_etag
+        
+        # Extracted CSVs are never modified, so any tail mismatch means corruption
+        tail_hash_path = self._tail_hash_path(output_path)
+        if not tail_hash_path.exists():
+            # Sidecars are only written after a complete download
+            self.logger.warning(f"   ⚠️  {output_path.name} has no integrity record, downloading again")
+            return False
+        
+        expected = tail_hash_path.read_text(encoding='utf-8').strip()
+        actual = self._compute_tail_hash(output_path, expected.split(':', 1)[0])
+        if actual is not None and actual != expected:
+            self.logger.warning(f"   ⚠️  {output_path.name} failed tail hash check")
+            return False
+        
+        return True
+    
     def download_and_extract_csv(self, year: int, url: str) -> Optional[Path]:
         """
         Download and extract a single CSV file from ZIP
@@ -256,22 +655,47 @@ class OpenDataSUSExtractor:
         Returns:
             Path to extracted CSV file or None if failed
         """
+        result = self._download_csv(year, url)
+        return result.path if result else None
+    
+    @log_data_operation(get_extraction_logger, "CSV file download and extraction")
+    def _download_csv(self, year: int, url: str) -> Optional[DownloadResult]:
+        """
+        Download and extract a single CSV file, keeping its size
+        
+        Args:
+            year: Year of the data
+            url: Download URL
+            
+        Returns:
+            DownloadResult for the extracted CSV or None if failed
+        """
         filename = self.config.get_raw_csv_filename(year)
         output_path = self.output_dir / filename
         
-        # Skip if already exists and is reasonable size
-        if output_path.exists():
-            size_mb = output_path.stat().st_size / (1024 * 1024)
-            if size_mb > 0.1:  # At least 100KB
-                self.logger.info(f"   ✅ {filename} already exists ({size_mb:.1f}MB)")
-                return output_path
+        # Skip if already exists, is reasonable size and matches the remote ETag
+        try:
+            existing_stat = output_path.stat()
+        except FileNotFoundError:
+            existing_stat = None
+        
+        if existing_stat is not None and self._is_existing_file_valid(year, output_path, existing_stat):
+            size_bytes = existing_stat.st_size
+            self.logger.info(f"   ✅ {filename} already exists ({size_bytes / (1024 * 1024):.1f}MB)")
+            return DownloadResult(output_path, size_bytes)
         
         try:
             self.logger.info(f"📥 Downloading {filename} from {url}")
             
             # Download with progress tracking
             response = self.session.get(url, stream=True, timeout=self.opendatasus_config["timeout"])
-            response.raise_for_status()
+            
+            # Check the status line before streaming the body (no separate HEAD validation)
+            if response.status_code != 200:
+                self.logger.warning(f"   ⚠️  {year} URL returned status: {response.status_code}")
+                self.logger.warning(f"⚠️  Skipping invalid URL for {year}")
+                response.close()
+                return None
             
             # Handle ZIP file extraction
             if url.endswith('.zip'):
@@ -281,19 +705,29 @@ class OpenDataSUSExtractor:
                 self._save_direct_csv(response, output_path)
             
             # Validate downloaded file
-            if output_path.exists():
-                size_mb = output_path.stat().st_size / (1024 * 1024)
-                
-                if size_mb < 0.01:  # Less than 10KB is probably an error
-                    self.logger.error(f"   ❌ File too small: {size_mb:.3f}MB")
-                    output_path.unlink()
-                    return None
-                
-                self.logger.info(f"   ✅ Successfully saved: {filename} ({size_mb:.1f}MB)")
-                return output_path
-            else:
+            try:
+                size_bytes = output_path.stat().st_size
+            except FileNotFoundError:
                 self.logger.error(f"   ❌ File was not created: {filename}")
                 return None
+            
+            size_mb = size_bytes / (1024 * 1024)
+            
+            if size_mb < 0.01:  # Less than 10KB is probably an error
+                self.logger.error(f"   ❌ File too small: {size_mb:.3f}MB")
+                output_path.unlink()
+                return None
+            
+            # Remember which remote version this file came from
+            etag = response.headers.get('etag') or self._remote_metadata.get(year, {}).get('etag')
+            if etag:
+                self._etag_path(output_path).write_text(etag, encoding='utf-8')
+            self._tail_hash_path(output_path).write_text(
+                self._compute_tail_hash(output_path), encoding='utf-8'
+            )
+            
+            self.logger.info(f"   ✅ Successfully saved: {filename} ({size_mb:.1f}MB)")
+            return DownloadResult(output_path, size_bytes)
                 
         except Exception as e:
             self.logger.error(f"   ❌ Download failed for {filename}: {str(e)}")
@@ -303,6 +737,12 @@ class OpenDataSUSExtractor:
         """
         Extract CSV from ZIP response
         
+        When the first ZIP entry is the CSV, it is inflated while the archive is
+        still downloading, so the total time is max(download, inflate) rather
+        than their sum and the ZIP is never held in memory. Other layouts fall
+        back to buffering the whole archive (in RAM up to ZIP_SPOOL_MAX_SIZE,
+        on disk beyond that) and reading its central directory.
+        
         Args:
             response: HTTP response containing ZIP data
             year: Year for logging
@@ -310,35 +750,266 @@ class OpenDataSUSExtractor:
         """
         self.logger.info(f"   📦 Extracting ZIP file for {year}...")
         
-        # Download ZIP content to memory with progress
-        zip_content = io.BytesIO()
+        # Extract next to the target and rename only once the CSV is complete,
+        # so a failed download never leaves a partial file under the real name
+        part_path = output_path.with_suffix('.part')
+        try:
+            self._extract_zip_stream(response, part_path)
+            os.replace(part_path, output_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+    
+    def _extract_zip_stream(self, response: requests.Response, output_path: Path):
+        """
+        Extract the first CSV of a ZIP response to output_path
+        
+        Args:
+            response: HTTP response containing ZIP data
+            output_path: Where to write the CSV
+        """
+        chunks = self._iter_zip_chunks(response)
+        header, head_bytes = self._read_zip_local_header(chunks)
+        
+        if header is not None and self._is_streamable_csv_entry(header):
+            self.logger.info(f"   📄 Extracting while downloading: {header['filename']}")
+            self._stream_inflate_csv(header, head_bytes[header['data_offset']:], chunks, output_path)
+            return
+        
+        # Download ZIP content with progress, spilling large archives to disk
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as zip_content:
+            spooled_bytes = zip_content.write(head_bytes)
+            for chunk in chunks:
+                spooled_bytes += zip_content.write(chunk)
+            
+            # Past max_size the spool has rolled over to a real file that sendfile can
+            # read from; below it, fileno() would force a needless rollover to disk
+            in_fd = zip_content.fileno() if spooled_bytes > ZIP_SPOOL_MAX_SIZE else None
+            
+            # Extract CSV from ZIP
+            zip_content.seek(0)
+            with zipfile.ZipFile(zip_content, 'r') as zip_file:
+                csv_files = [f for f in zip_file.namelist() if f.endswith('.csv')]
+                
+                if not csv_files:
+                    raise Exception("No CSV file found in ZIP")
+                
+                csv_filename = csv_files[0]
+                self.logger.info(f"   📄 Extracting: {csv_filename}")
+                
+                with open(output_path, 'wb') as output_file:
+                    self._write_zip_member(zip_file, zip_file.getinfo(csv_filename), output_file, in_fd)
+    
+    def _iter_zip_chunks(self, response: requests.Response) -> Iterator[bytes]:
+        """
+        Yield the ZIP body chunk by chunk with progress logging
+        
+        Args:
+            response: HTTP response containing ZIP data
+            
+        Yields:
+            Non-empty chunks of the response body
+        """
         downloaded_mb = 0
+        next_log_mb = 1.0
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
-        for chunk in response.iter_content(chunk_size=8192):
+        for chunk in response.iter_content(chunk_size=COPY_BUFFER_SIZE):
             if chunk:
-                zip_content.write(chunk)
                 downloaded_mb += len(chunk) / (1024 * 1024)
                 
-                # Log progress every 1MB
-                if int(downloaded_mb) % 1 == 0 and downloaded_mb > 0:
+                # Log progress every 10MB (only when debug output is on)
+                if debug_enabled and downloaded_mb >= next_log_mb:
                     self.logger.debug(f"   📊 Downloaded: {downloaded_mb:.1f}MB")
+                    next_log_mb += 10.0
+                
+                yield chunk
         
         self.logger.info(f"   ✅ ZIP downloaded: {downloaded_mb:.1f}MB")
+    
+    @staticmethod
+    def _read_zip_local_header(chunks: Iterator[bytes]) -> Tuple[Optional[Dict[str, Any]], bytes]:
+        """
+        Read and parse the local file header of the first ZIP entry
         
-        # Extract CSV from ZIP
-        zip_content.seek(0)
-        with zipfile.ZipFile(zip_content, 'r') as zip_file:
-            csv_files = [f for f in zip_file.namelist() if f.endswith('.csv')]
+        Args:
+            chunks: Iterator over the ZIP body
             
-            if not csv_files:
-                raise Exception("No CSV file found in ZIP")
+        Returns:
+            Tuple of (parsed header or None if not a ZIP entry, bytes consumed so far)
+        """
+        buffer = bytearray()
+        
+        for chunk in chunks:
+            buffer += chunk
             
-            csv_filename = csv_files[0]
-            self.logger.info(f"   📄 Extracting: {csv_filename}")
+            # Local file header: 30 fixed bytes followed by name and extra field
+            if len(buffer) < 30:
+                continue
+            if buffer[:4] != b'PK\x03\x04':
+                return None, bytes(buffer)
             
-            with zip_file.open(csv_filename) as csv_file:
-                with open(output_path, 'wb') as output_file:
-                    output_file.write(csv_file.read())
+            (flag_bits, compress_type, crc, compress_size, file_size,
+             name_length, extra_length) = struct.unpack('<2x2H4x3L2H', buffer[4:30])
+            data_offset = 30 + name_length + extra_length
+            if len(buffer) < data_offset:
+                continue
+            
+            raw_name = bytes(buffer[30:30 + name_length])
+            header = {
+                'filename': raw_name.decode('utf-8' if flag_bits & 0x800 else 'cp437'),
+                'flag_bits': flag_bits,
+                'compress_type': compress_type,
+                'crc': crc,
+                'compress_size': compress_size,
+                'file_size': file_size,
+                'data_offset': data_offset
+            }
+            return header, bytes(buffer)
+        
+        return None, bytes(buffer)
+    
+    @staticmethod
+    def _is_streamable_csv_entry(header: Dict[str, Any]) -> bool:
+        """Check whether a ZIP entry can be extracted straight from the byte stream"""
+        if not header['filename'].endswith('.csv') or header['flag_bits'] & 0x1:  # encrypted
+            return False
+        
+        if header['compress_type'] == zipfile.ZIP_DEFLATED:
+            return True  # the deflate stream marks its own end
+        
+        # STORED entries need their size up front (no data descriptor, no ZIP64)
+        return (header['compress_type'] == zipfile.ZIP_STORED and
+                not header['flag_bits'] & 0x8 and
+                header['compress_size'] != 0xFFFFFFFF)
+    
+    def _stream_inflate_csv(self, header: Dict[str, Any], data: bytes,
+                            chunks: Iterator[bytes], output_path: Path):
+        """
+        Write the first ZIP entry to disk while the rest is still downloading
+        
+        Args:
+            header: Parsed local file header of the entry
+            data: Entry bytes already read past the header
+            chunks: Iterator over the remaining ZIP body
+            output_path: Where to save the extracted CSV
+        """
+        has_descriptor = bool(header['flag_bits'] & 0x8)
+        crc = 0
+        written = 0
+        
+        with open(output_path, 'wb') as output_file:
+            if not has_descriptor and header['file_size'] != 0xFFFFFFFF:
+                self._preallocate(output_file, header['file_size'])
+            
+            if header['compress_type'] == zipfile.ZIP_DEFLATED:
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                pending = data
+                
+                while True:
+                    # Bounded output per call keeps memory flat for highly compressible CSVs
+                    inflated = decompressor.decompress(pending, COPY_BUFFER_SIZE)
+                    crc = zlib.crc32(inflated, crc)
+                    written += output_file.write(inflated)
+                    if decompressor.eof:
+                        break
+                    pending = decompressor.unconsumed_tail
+                    if not pending:
+                        pending = next(chunks, None)
+                        if pending is None:
+                            raise Exception(f"Truncated ZIP stream: {header['filename']}")
+                
+                trailer = decompressor.unused_data
+            else:
+                remaining = header['compress_size']
+                pending = data
+                
+                while True:
+                    piece = pending[:remaining]
+                    crc = zlib.crc32(piece, crc)
+                    written += output_file.write(piece)
+                    remaining -= len(piece)
+                    if remaining == 0:
+                        break
+                    pending = next(chunks, None)
+                    if pending is None:
+                        raise Exception(f"Truncated ZIP stream: {header['filename']}")
+                
+                trailer = pending[len(piece):]
+        
+        expected_crc = header['crc']
+        if has_descriptor:
+            # Data descriptor: optional signature, then CRC-32
+            while len(trailer) < 8:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                trailer += chunk
+            offset = 4 if trailer[:4] == b'PK\x07\x08' else 0
+            expected_crc = struct.unpack('<L', trailer[offset:offset + 4])[0]
+        
+        if crc != expected_crc:
+            raise Exception(f"CRC mismatch while extracting {header['filename']}")
+        if not has_descriptor and header['file_size'] != 0xFFFFFFFF and written != header['file_size']:
+            raise Exception(f"Size mismatch while extracting {header['filename']}")
+        
+        # Read the central directory so the connection returns to the pool
+        for _ in chunks:
+            pass
+    
+    def _write_zip_member(self, zip_file: zipfile.ZipFile, member: zipfile.ZipInfo, output_file,
+                          in_fd: Optional[int] = None):
+        """
+        Write a single ZIP member to an open output file
+        
+        Uncompressed (STORED) members of an archive backed by a real file are
+        copied kernel-to-kernel with os.sendfile and their CRC-32 is checked
+        afterwards; everything else is inflated through a 1MB userspace buffer.
+        
+        Args:
+            zip_file: Open ZIP archive
+            member: Member to extract
+            output_file: Binary file object to write to
+            in_fd: File descriptor of the archive when it is backed by a real file
+        """
+        self._preallocate(output_file, member.file_size)
+        
+        if (in_fd is not None and
+                member.compress_type == zipfile.ZIP_STORED and
+                not member.flag_bits & 0x1 and  # not encrypted
+                sys.platform.startswith('linux')):
+            # Local file header: 30 fixed bytes, name/extra lengths at offset 26
+            header = os.pread(in_fd, 30, member.header_offset)
+            if header[:4] == b'PK\x03\x04':
+                name_length, extra_length = struct.unpack('<HH', header[26:30])
+                data_offset = member.header_offset + 30 + name_length + extra_length
+                offset = data_offset
+                remaining = member.file_size
+                out_fd = output_file.fileno()
+                output_file.flush()
+                
+                while remaining > 0:
+                    sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                
+                if remaining != 0:
+                    raise Exception(f"Truncated ZIP member: {member.filename}")
+                
+                # sendfile copies raw bytes, so check the CRC zipfile would have checked
+                # (the source range is still in the page cache)
+                crc = 0
+                for block_offset in range(data_offset, data_offset + member.file_size, COPY_BUFFER_SIZE):
+                    length = min(COPY_BUFFER_SIZE, data_offset + member.file_size - block_offset)
+                    crc = zlib.crc32(os.pread(in_fd, length, block_offset), crc)
+                if crc != member.CRC:
+                    raise Exception(f"CRC mismatch while extracting {member.filename}")
+                return
+        
+        with zip_file.open(member) as member_file:
+            shutil.copyfileobj(member_file, output_file, length=COPY_BUFFER_SIZE)
     
     def _save_direct_csv(self, response: requests.Response, output_path: Path):
         """
@@ -349,25 +1020,84 @@ class OpenDataSUSExtractor:
             output_path: Where to save the CSV
         """
         with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            content_length = int(response.headers.get('Content-Length') or 0)
+            self._preallocate(f, content_length)
+            
+            # Let copyfileobj drive the read/write loop with 1MB buffers,
+            # still undoing any gzip/deflate transfer encoding
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, f, COPY_BUFFER_SIZE)
+            
+            # Drop any preallocated space the body did not fill
+            f.truncate()
     
-    def check_existing_files(self) -> Dict[int, Dict[str, any]]:
+    @staticmethod
+    def _preallocate(file_obj, length: int):
+        """
+        Reserve disk space for a file of known size to avoid fragmentation
+        
+        Args:
+            file_obj: Open binary file object
+            length: Expected final size in bytes
+        """
+        if length > 0 and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(file_obj.fileno(), 0, length)
+            except OSError:
+                pass  # Filesystem does not support preallocation
+    
+    def _existing_index(self, years: Optional[List[int]] = None) -> Dict[int, os.stat_result]:
+        """
+        Find existing raw CSV files with a single directory scan
+        
+        Args:
+            years: Years to look for (default: from config)
+            
+        Returns:
+            Dictionary mapping year to stat result, only for files that exist
+        """
+        if years is None:
+            years = self.config.target_years
+        
+        filename_to_year = {self.config.get_raw_csv_filename(year): year for year in years}
+        index = {}
+        
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    year = filename_to_year.get(entry.name)
+                    if year is not None and entry.is_file():
+                        index[year] = entry.stat()
+        except FileNotFoundError:
+            pass
+        
+        return index
+    
+    def check_existing_files(self, years: Optional[List[int]] = None,
+                             existing_index: Optional[Dict[int, os.stat_result]] = None) -> Dict[int, Dict[str, any]]:
         """
         Check what files already exist and their status
         
+        Args:
+            years: Years to check (default: from config)
+            existing_index: Result of _existing_index to reuse instead of scanning again
+            
         Returns:
             Dictionary with file status for each year
         """
+        if years is None:
+            years = self.config.target_years
+        if existing_index is None:
+            existing_index = self._existing_index(years)
+        
         file_status = {}
         
-        for year in self.config.target_years:
+        for year in years:
             filename = self.config.get_raw_csv_filename(year)
             file_path = self.output_dir / filename
+            stat = existing_index.get(year)
             
-            if file_path.exists():
-                stat = file_path.stat()
+            if stat is not None:
                 file_status[year] = {
                     'exists': True,
                     'size_mb': stat.st_size / (1024 * 1024),
@@ -384,7 +1114,7 @@ class OpenDataSUSExtractor:
         
         return file_status
     
-    @log_data_operation(get_extraction_logger(), "Complete multi-year extraction")
+    @log_data_operation(get_extraction_logger, "Complete multi-year extraction")
     def extract_all_years(self, years: Optional[List[int]] = None, force_redownload: bool = False) -> Dict[int, Optional[Path]]:
         """
         Extract CSV files for all specified years
@@ -401,98 +1131,95 @@ class OpenDataSUSExtractor:
         
         self.logger.info(f"🚀 Starting extraction for years: {years}")
         
-        # Validate connection first
-        if not self.validate_connection():
-            raise Exception("Cannot connect to OpenDataSUS portal")
-        
-        # Check existing files
-        if not force_redownload:
-            existing_files = self.check_existing_files()
-            self.logger.info("📋 Existing files status:")
-            for year, status in existing_files.items():
-                if year in years:
-                    if status['exists']:
-                        self.logger.info(f"   ✅ {year}: {status['size_mb']:.1f}MB (modified: {status['modified'].strftime('%Y-%m-%d %H:%M')})")
-                    else:
-                        self.logger.info(f"   ❌ {year}: Not found")
-        
-        # Discover download links
-        csv_links = self.discover_csv_download_links(years)
+        # Validate connection and discover download links from the same page fetch
+        csv_links = self._fetch_and_discover(years)
         
         if not csv_links:
             raise Exception("No CSV download links discovered")
         
-        # Validate URLs before downloading
-        self.logger.info("🔍 Validating download URLs...")
-        valid_links = {}
-        for year, url in csv_links.items():
-            if self._validate_csv_url(year, url):
-                valid_links[year] = url
-            else:
-                self.logger.warning(f"⚠️  Skipping invalid URL for {year}")
-        
-        if not valid_links:
-            raise Exception("No valid download URLs found")
+        # Check existing files (one directory scan, reused by the download loop)
+        existing_index = {}
+        if not force_redownload:
+            existing_index = self._existing_index(years)
+            existing_files = self.check_existing_files(years, existing_index)
+            self.logger.info("📋 Existing files status:")
+            for year, status in existing_files.items():
+                if status['exists']:
+                    self.logger.info(f"   ✅ {year}: {status['size_mb']:.1f}MB (modified: {status['modified'].strftime('%Y-%m-%d %H:%M')})")
+                else:
+                    self.logger.info(f"   ❌ {year}: Not found")
         
         # Download files with progress tracking
-        downloaded_files = {}
+        download_results: Dict[int, DownloadResult] = {}
         
-        with log_progress(self.logger, len(valid_links), "Downloading CSV files") as progress:
-            for i, (year, url) in enumerate(valid_links.items(), 1):
-                
+        with log_progress(self.logger, len(csv_links), "Downloading CSV files") as progress:
+            completed = 0
+            pending_links = {}
+            
+            for year, url in csv_links.items():
                 # Skip if file exists and not forcing redownload
                 if not force_redownload:
                     filename = self.config.get_raw_csv_filename(year)
                     existing_path = self.output_dir / filename
-                    if existing_path.exists() and existing_path.stat().st_size > 100000:  # > 100KB
+                    stat = existing_index.get(year)
+                    if stat is not None and self._is_existing_file_valid(year, existing_path, stat):
                         self.logger.info(f"   ⏭️  Skipping {year} (file exists)")
-                        downloaded_files[year] = existing_path
-                        progress(i)
+                        download_results[year] = DownloadResult(existing_path, stat.st_size)
+                        completed += 1
+                        progress(completed)
                         continue
                 
-                # Download the file
-                file_path = self.download_and_extract_csv(year, url)
-                if file_path:
-                    downloaded_files[year] = file_path
-                
-                # Be respectful to the server
-                delay = self.opendatasus_config["request_delay"]
-                if i < len(valid_links):  # Don't delay after last download
-                    self.logger.debug(f"   ⏸️  Pausing {delay} seconds...")
-                    time.sleep(delay)
+                pending_links[year] = url
+            
+            # Download concurrently; the bounded pool keeps us respectful to the server
+            if pending_links:
+                max_workers = min(self.config.performance_config["max_workers"], len(pending_links))
+                self.logger.info(f"📥 Downloading {len(pending_links)} files ({max_workers} concurrent)")
                 
-                progress(i)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(self._download_csv, year, url): year
+                        for year, url in pending_links.items()
+                    }
+                    for future in as_completed(futures):
+                        result = future.result()
+                        if result:
+                            download_results[futures[future]] = result
+                        completed += 1
+                        progress(completed)
+        
+        # Keep results in the requested year order
+        download_results = {
+            year: download_results[year] for year in csv_links if year in download_results
+        }
         
-        # Summary
-        success_count = len(downloaded_files)
+        # Summary (sizes were measured during download, no extra stat calls)
+        success_count = len(download_results)
         total_count = len(years)
         
         self.logger.info(f"✅ Extraction completed: {success_count}/{total_count} files")
         
-        if downloaded_files:
-            total_size = sum(
-                path.stat().st_size / (1024 * 1024) 
-                for path in downloaded_files.values() 
-                if path and path.exists()
-            )
+        if download_results:
+            total_size = sum(result.size_bytes for result in download_results.values()) / (1024 * 1024)
             self.logger.info(f"💾 Total downloaded: {total_size:.1f}MB")
             
             # Log individual file info
-            for year, path in downloaded_files.items():
-                if path and path.exists():
-                    size_mb = path.stat().st_size / (1024 * 1024)
-                    self.logger.info(f"   📄 {year}: {size_mb:.1f}MB")
+            for year, result in download_results.items():
+                self.logger.info(f"   📄 {year}: {result.size_bytes / (1024 * 1024):.1f}MB")
         
-        return downloaded_files
+        return {year: result.path for year, result in download_results.items()}
     
-    def get_extraction_summary(self) -> Dict[str, any]:
+    def get_extraction_summary(self, existing_index: Optional[Dict[int, os.stat_result]] = None) -> Dict[str, any]:
         """
         Get summary of current extraction status
         
+        Args:
+            existing_index: Result of _existing_index to reuse instead of scanning again
+            
         Returns:
             Dictionary with extraction summary
         """
-        file_status = self.check_existing_files()
+        file_status = self.check_existing_files(existing_index=existing_index)
         
         total_files = len(self.config.target_years)
         existing_files = sum(1 for status in file_status.values() if status['exists'])
@@ -515,6 +1242,9 @@ class OpenDataSUSExtractor:
         """
         Save metadata about the extraction process
         
+        The file is only rewritten when the set of files (year, mtime, size)
+        differs from the signature stored in the existing metadata.
+        
         Args:
             downloaded_files: Dictionary of downloaded files by year
         """
@@ -531,26 +1261,61 @@ class OpenDataSUSExtractor:
             }
         }
         
-        # Add file details
-        for year, path in downloaded_files.items():
-            if path and path.exists():
-                stat = path.stat()
-                metadata['file_details'][year] = {
-                    'filename': path.name,
-                    'size_bytes': stat.st_size,
-                    'size_mb': stat.st_size / (1024 * 1024),
-                    'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                }
+        # Add file details, building the change signature from the same stat
+        file_signature = []
+        for year, path in sorted(downloaded_files.items()):
+            stat = None
+            if path:
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    pass
+            
+            if stat is None:
+                file_signature.append([year, None, None])
+                continue
+            
+            file_signature.append([year, stat.st_mtime_ns, stat.st_size])
+            metadata['file_details'][year] = {
+                'filename': path.name,
+                'size_bytes': stat.st_size,
+                'size_mb': stat.st_size / (1024 * 1024),
+                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+            }
         
-        # Save metadata
+        signature = {'target_years': list(self.config.target_years), 'files': file_signature}
+        metadata['_signature'] = signature
+        
+        # Skip the rewrite if nothing changed since the last save
         metadata_path = self.output_dir / 'extraction_metadata.json'
+        try:
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                if json.load(f).get('_signature') == signature:
+                    self.logger.info(f"💾 Extraction metadata unchanged: {metadata_path}")
+                    return
+        except (OSError, ValueError, AttributeError):
+            pass  # Missing or unreadable metadata is simply rewritten
+        
+        # Save metadata
         with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+            json.dump(metadata, f, ensure_ascii=False, separators=(',', ':'))
         
         self.logger.info(f"💾 Extraction metadata saved: {metadata_path}")
 
 
+# Shared extractor so successive convenience calls reuse one keep-alive session
+_extractor: Optional[OpenDataSUSExtractor] = None
+
+
+def _get_extractor() -> OpenDataSUSExtractor:
+    """Get the module-level extractor instance, creating it on first use"""
+    global _extractor
+    if _extractor is None:
+        _extractor = OpenDataSUSExtractor()
+    return _extractor
+
+
 # Convenience functions for easy usage
 def extract_health_data(years: Optional[List[int]] = None, force_redownload: bool = False) -> Dict[int, Optional[Path]]:
     """
@@ -563,8 +1328,7 @@ def extract_health_data(years: Optional[List[int]] = None, force_redownload: boo
     Returns:
         Dictionary mapping year to downloaded file path
     """
-    extractor = OpenDataSUSExtractor()
-    return extractor.extract_all_years(years, force_redownload)
+    return _get_extractor().extract_all_years(years, force_redownload)
 
 
 def get_extraction_status() -> Dict[str, any]:
@@ -574,8 +1338,7 @@ def get_extraction_status() -> Dict[str, any]:
     Returns:
         Dictionary with extraction summary
     """
-    extractor = OpenDataSUSExtractor()
-    return extractor.get_extraction_summary()
+    return _get_extractor().get_extraction_summary()
 
 
 def validate_extraction_setup() -> bool:
@@ -586,8 +1349,7 @@ def validate_extraction_setup() -> bool:
         True if setup is valid, False otherwise
     """
     try:
-        extractor = OpenDataSUSExtractor()
-        return extractor.validate_connection()
+        return _get_extractor().validate_connection()
     except Exception:
         return False
 
@@ -611,7 +1373,7 @@ if __name__ == "__main__":
         print(f"   Completion: {status['completion_percentage']:.1f}%")
         
         # Test extraction (just discovery, no download)
-        extractor = OpenDataSUSExtractor()
+        extractor = _get_extractor()
         links = extractor.discover_csv_download_links([2024])  # Test with just 2024
         print(f"\n🔗 Test link discovery: {len(links)} links found")
         
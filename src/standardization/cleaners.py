@@ -6,12 +6,32 @@ OpenDataSUS, focusing on Brazilian-specific data issues like encoding
 artifacts, CNPJ formats, and currency representations.
 """
 
+import functools
 import re
 import pandas as pd
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 
+# Precompiled patterns shared by the scalar and column-wise cleaners
+NON_WORD_RE = re.compile(r'[^\w]')
+UNDERSCORE_RUN_RE = re.compile(r'_+')
+NON_DIGIT_RE = re.compile(r'\D')
+CURRENCY_SYMBOLS_RE = re.compile(r'[R$\s]')
+NON_NUMERIC_RE = re.compile(r'[^\d.]')
+THOUSANDS_DECIMAL_RE = re.compile(r'^(.*)\.([^.,]*),([^.,]*)$')
+
+# Portuguese characters to ASCII, applied to column names in one translate() call
+COLUMN_NAME_TRANSLATION = str.maketrans({
+    'ã': 'a', 'á': 'a', 'â': 'a', 'à': 'a',
+    'é': 'e', 'ê': 'e', 'è': 'e',
+    'í': 'i', 'î': 'i', 'ì': 'i',
+    'ó': 'o', 'ô': 'o', 'õ': 'o', 'ò': 'o',
+    'ú': 'u', 'û': 'u', 'ù': 'u',
+    'ç': 'c', 'ñ': 'n'
+})
+
+
 def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardize column names by removing special characters and normalizing case.
@@ -28,36 +48,22 @@ def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
         >>> list(result.columns)
         ['ano', 'codigo_br']
     """
-    df_clean = df.copy()
-    
-    # Mapping for Portuguese characters to ASCII
-    char_map = {
-        'ã': 'a', 'á': 'a', 'â': 'a', 'à': 'a',
-        'é': 'e', 'ê': 'e', 'è': 'e',
-        'í': 'i', 'î': 'i', 'ì': 'i',
-        'ó': 'o', 'ô': 'o', 'õ': 'o', 'ò': 'o',
-        'ú': 'u', 'û': 'u', 'ù': 'u',
-        'ç': 'c', 'ñ': 'n'
-    }
+    df_clean = df.copy(deep=False)  # Columns are replaced, never written in place
     
     # Clean column names
     new_columns = []
     for col in df_clean.columns:
-        # Convert to lowercase
-        clean_col = str(col).lower()
-        
-        # Remove extra whitespace
-        clean_col = clean_col.strip()
+        # Convert to lowercase and remove extra whitespace
+        clean_col = str(col).lower().strip()
         
         # Replace Portuguese characters with ASCII equivalents
-        for pt_char, ascii_char in char_map.items():
-            clean_col = clean_col.replace(pt_char, ascii_char)
+        clean_col = clean_col.translate(COLUMN_NAME_TRANSLATION)
         
         # Replace spaces and special chars with underscores
-        clean_col = re.sub(r'[^\w]', '_', clean_col)
+        clean_col = NON_WORD_RE.sub('_', clean_col)
         
         # Remove multiple underscores
-        clean_col = re.sub(r'_+', '_', clean_col)
+        clean_col = UNDERSCORE_RUN_RE.sub('_', clean_col)
         
         # Remove leading/trailing underscores
         clean_col = clean_col.strip('_')
@@ -84,17 +90,75 @@ def fix_brazilian_encoding(text: str, encoding_fixes: Dict[str, str]) -> str:
         >>> fix_brazilian_encoding("MEDICAÃ§ÃO", fixes)
         'MEDICAÇÃO'
     """
-    if pd.isna(text) or not isinstance(text, str):
+    if pd.isna(text) or not isinstance(text, str) or not encoding_fixes:
         return text
     
-    fixed_text = text
-    # Apply fixes in order of longest match first to avoid double replacements
-    sorted_fixes = sorted(encoding_fixes.items(), key=lambda x: len(x[0]), reverse=True)
+    pattern = build_encoding_fix_pattern(encoding_fixes)
+    return pattern.sub(lambda match: encoding_fixes[match.group(0)], text)
+
+
+def build_encoding_fix_pattern(encoding_fixes: Dict[str, str]) -> re.Pattern:
+    """
+    Compile all encoding fixes into a single alternation regex.
+    
+    Longer artifacts come first so they win over their own prefixes, and each
+    artifact is replaced once in a single scan, so a fix never feeds another.
+    
+    Args:
+        encoding_fixes: Dictionary mapping corrupted text to correct text
+        
+    Returns:
+        Compiled pattern matching any corrupted text
+    """
+    return _compile_encoding_fix_pattern(tuple(encoding_fixes))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_encoding_fix_pattern(corrupted: tuple) -> re.Pattern:
+    """Build the alternation once per set of artifacts (fix_brazilian_encoding runs per cell)"""
+    return re.compile('|'.join(map(re.escape, sorted(corrupted, key=len, reverse=True))))
+
+
+def replace_in_text_cells(series: pd.Series, pattern: re.Pattern, repl) -> pd.Series:
+    """
+    Apply a regex substitution to the string cells of a column only.
+    
+    Like fix_brazilian_encoding, values that are not strings (numbers,
+    booleans, missing values) are left untouched and the column keeps its
+    dtype. String columns are replaced in one column-wide pass; categorical
+    columns only fix their distinct values.
     
-    for corrupted, correct in sorted_fixes:
-        fixed_text = fixed_text.replace(corrupted, correct)
+    Args:
+        series: Column to clean
+        pattern: Compiled pattern to substitute
+        repl: Replacement string or function, as for re.sub
+        
+    Returns:
+        Column with the substitution applied to its string cells
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        return series.str.replace(pattern, repl, regex=True)
+    
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Fix the distinct values only, rows keep pointing at their category
+        categories = series.cat.categories
+        fixed = categories.map(lambda x: pattern.sub(repl, x) if isinstance(x, str) else x)
+        if fixed.is_unique:
+            return series.cat.rename_categories(fixed)
+        # Some artifacts collapse onto an existing value: merge those categories
+        return series.map(dict(zip(categories, fixed))).astype('category')
+    
+    if series.dtype != object:
+        return series  # Numeric, boolean and datetime columns hold no text
+    
+    if pd.api.types.infer_dtype(series, skipna=True) == 'string':
+        return series.str.replace(pattern, repl, regex=True)
     
-    return fixed_text
+    # Mixed object column: substitute in the str cells, keep everything else
+    is_text = series.map(lambda value: isinstance(value, str))
+    if not is_text.any():
+        return series
+    return series.mask(is_text, series[is_text].str.replace(pattern, repl, regex=True))
 
 
 def clean_text_columns(df: pd.DataFrame, text_columns: List[str], 
@@ -110,12 +174,17 @@ def clean_text_columns(df: pd.DataFrame, text_columns: List[str],
     Returns:
         DataFrame with cleaned text columns
     """
-    df_clean = df.copy()
+    df_clean = df.copy(deep=False)
+    if not encoding_fixes:
+        return df_clean
+    
+    # One compiled pattern, one column-wide pass per column
+    pattern = build_encoding_fix_pattern(encoding_fixes)
     
     for col in text_columns:
         if col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(
-                lambda x: fix_brazilian_encoding(x, encoding_fixes)
+            df_clean[col] = replace_in_text_cells(
+                df_clean[col], pattern, lambda match: encoding_fixes[match.group(0)]
             )
     
     return df_clean
@@ -143,7 +212,7 @@ def standardize_cnpj(cnpj: str) -> Optional[str]:
         return None
     
     # Remove all non-digit characters
-    digits_only = re.sub(r'\D', '', cnpj)
+    digits_only = NON_DIGIT_RE.sub('', cnpj)
     
     # CNPJ must have exactly 14 digits
     if len(digits_only) == 14:
@@ -163,11 +232,13 @@ def clean_cnpj_columns(df: pd.DataFrame, cnpj_columns: List[str]) -> pd.DataFram
     Returns:
         DataFrame with standardized CNPJ columns
     """
-    df_clean = df.copy()
+    df_clean = df.copy(deep=False)
     
     for col in cnpj_columns:
         if col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(standardize_cnpj)
+            # Same rule as standardize_cnpj, run by pandas' string kernels
+            digits_only = df_clean[col].astype('string').str.replace(NON_DIGIT_RE, '', regex=True)
+            df_clean[col] = digits_only.where(digits_only.str.len() == 14, pd.NA)
     
     return df_clean
 
@@ -194,7 +265,7 @@ def clean_currency_value(value: str) -> Optional[float]:
         return None
     
     # Remove currency symbols and whitespace
-    clean_value = re.sub(r'[R$\s]', '', str(value))
+    clean_value = CURRENCY_SYMBOLS_RE.sub('', str(value))
     
     # Handle Brazilian number format (comma as decimal separator)
     if ',' in clean_value:
@@ -214,7 +285,7 @@ def clean_currency_value(value: str) -> Optional[float]:
             clean_value = clean_value.replace(',', '.')
     
     # Remove any remaining non-digit/non-decimal characters
-    clean_value = re.sub(r'[^\d.]', '', clean_value)
+    clean_value = NON_NUMERIC_RE.sub('', clean_value)
     
     try:
         return float(clean_value)
@@ -233,11 +304,30 @@ def clean_currency_columns(df: pd.DataFrame, currency_columns: List[str]) -> pd.
     Returns:
         DataFrame with cleaned currency columns
     """
-    df_clean = df.copy()
+    df_clean = df.copy(deep=False)
     
     for col in currency_columns:
         if col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(clean_currency_value)
+            # Same rules as clean_currency_value, applied to the whole column
+            values = df_clean[col].astype('string').str.replace(CURRENCY_SYMBOLS_RE, '', regex=True)
+            has_comma = values.str.contains(',', regex=False).fillna(False)
+            has_period = values.str.contains('.', regex=False).fillna(False)
+            
+            # Only comma, treat as decimal separator
+            comma_only = has_comma & ~has_period
+            values = values.mask(comma_only, values.str.replace(',', '.', regex=False))
+            
+            # Periods are thousands separators when a single comma follows the last one
+            parts = values.str.extract(THOUSANDS_DECIMAL_RE)
+            thousands_format = has_comma & has_period & parts[0].notna()
+            values = values.mask(
+                thousands_format,
+                parts[0].str.replace('.', '', regex=False) + parts[1] + '.' + parts[2]
+            )
+            
+            # Remove any remaining non-digit/non-decimal characters
+            values = values.str.replace(NON_NUMERIC_RE, '', regex=True)
+            df_clean[col] = pd.to_numeric(values, errors='coerce').astype('float64')
     
     return df_clean
 
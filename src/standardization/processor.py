@@ -3,10 +3,32 @@ Simple standardization processor that combines cleaning and validation.
 Focused on core functionality without over-engineering.
 """
 
+import os
+import numpy as np
 import pandas as pd
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional: pandas reads the CSV files instead
+    pa = None
+    pacsv = None
+
+from standardization.cleaners import (
+    CURRENCY_SYMBOLS_RE, NON_DIGIT_RE, build_encoding_fix_pattern, replace_in_text_cells,
+    standardize_column_names
+)
+from standardization.validators import VALID_STATES, limit_worker_threads, validate_cnpj_array
+from utils.files import sniff_csv_format
+from utils.logger import get_standardization_logger
+
+
+# Text columns with few distinct values, stored as categories while cleaning
+LOW_CARDINALITY_COLUMNS = ['uf', 'fabricante', 'fornecedor', 'nome_instituicao', 'municipio_instituicao']
 
 
 class SimpleStandardizationProcessor:
@@ -24,6 +46,9 @@ class SimpleStandardizationProcessor:
         """
         Load a raw CSV file with Brazilian encoding handling.
         
+        The encoding and delimiter are sniffed from the first bytes of the
+        file, so the CSV is parsed once instead of trying configurations.
+        
         Args:
             file_path: Path to the CSV file
             
@@ -32,35 +57,60 @@ class SimpleStandardizationProcessor:
         """
         self.logger.info(f"Loading {file_path.name}...")
         
+        encoding, sep = sniff_csv_format(file_path)
+        
         try:
-            # Try primary encoding first (latin-1 with semicolon)
-            df = pd.read_csv(file_path, encoding='latin-1', sep=';')
-            self.logger.info(f"Loaded {len(df):,} rows with latin-1 encoding")
-            
+            df = self._read_csv(file_path, encoding=encoding, sep=sep)
         except Exception as e:
-            self.logger.warning(f"Primary encoding failed, trying fallbacks...")
+            if encoding == 'latin-1':
+                raise Exception(f"Failed to load {file_path.name}: {str(e)}")
             
-            # Try alternative configurations
-            fallback_configs = [
-                {'encoding': 'utf-8', 'sep': ';'},
-                {'encoding': 'latin-1', 'sep': ','},
-                {'encoding': 'utf-8', 'sep': ','},
-            ]
-            
-            df = None
-            for config in fallback_configs:
-                try:
-                    df = pd.read_csv(file_path, **config)
-                    self.logger.info(f"Loaded with {config}")
-                    break
-                except Exception:
-                    continue
-            
-            if df is None:
-                raise Exception(f"Failed to load {file_path.name} with any encoding")
+            # Non-UTF-8 bytes can appear after the sniffed sample; latin-1 decodes anything
+            self.logger.warning(f"{encoding} decoding failed, retrying with latin-1...")
+            encoding = 'latin-1'
+            df = self._read_csv(file_path, encoding=encoding, sep=sep)
         
+        self.logger.info(f"Loaded {len(df):,} rows with {encoding} encoding (sep '{sep}')")
         return df
     
+    def _read_csv(self, file_path: Path, encoding: str, sep: str) -> pd.DataFrame:
+        """Read a CSV with pyarrow's multithreaded reader when available."""
+        # Columns with a configured type skip type inference
+        raw_dtypes = getattr(self.config, 'raw_dtypes', {})
+        
+        if pacsv is None:
+            return pd.read_csv(file_path, encoding=encoding, sep=sep, dtype=raw_dtypes,
+                               engine='c', low_memory=False)
+        
+        arrow_types = {'string': pa.string(), 'category': pa.dictionary(pa.int32(), pa.string())}
+        column_types = {col: arrow_types[dtype] for col, dtype in raw_dtypes.items() if dtype in arrow_types}
+        
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(encoding=encoding),
+            parse_options=pacsv.ParseOptions(delimiter=sep),
+            # Match pandas: empty strings are missing, dates stay as text
+            convert_options=pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True,
+                                                 timestamp_parsers=[])
+        )
+        
+        # pyarrow keeps undecodable text as binary columns instead of failing
+        binary_columns = [field.name for field in table.schema if pa.types.is_binary(field.type)]
+        if binary_columns:
+            raise UnicodeError(f"Columns not valid {encoding}: {binary_columns}")
+        
+        return table.to_pandas()
+    
+    def _write_csv(self, df: pd.DataFrame, output_path: Path):
+        """
+        Write a UTF-8, comma-separated CSV.
+        
+        Always written by pandas: pyarrow's writer formats values differently
+        (quoting, 3.0 as 3), and the output must not depend on which optional
+        packages are installed.
+        """
+        df.to_csv(output_path, index=False, encoding='utf-8', sep=',')
+    
     def clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply comprehensive cleaning to a DataFrame.
@@ -73,23 +123,28 @@ class SimpleStandardizationProcessor:
         """
         self.logger.info("Applying data cleaning...")
         
-        # Copy for safety
-        df_clean = df.copy()
+        # Shallow copy: every step replaces whole columns, so the input is never modified
+        df_clean = df.copy(deep=False)
         
         # 1. Standardize column names (ASCII-only)
-        df_clean = self._standardize_column_names(df_clean)
+        df_clean = standardize_column_names(df_clean)
+        
+        # 2. Store repetitive text as categories so cleaning touches each distinct value once
+        for col in LOW_CARDINALITY_COLUMNS:
+            if col in df_clean.columns:
+                df_clean[col] = df_clean[col].astype('category')
         
-        # 2. Clean text columns (encoding fixes)
+        # 3. Clean text columns (encoding fixes)
         text_columns = [col for col in df_clean.columns 
                        if any(keyword in col.lower() for keyword in 
                              ['descricao', 'fabricante', 'fornecedor', 'instituicao', 'municipio'])]
         df_clean = self._clean_text_columns(df_clean, text_columns)
         
-        # 3. Clean CNPJ columns
+        # 4. Clean CNPJ columns
         cnpj_columns = [col for col in df_clean.columns if 'cnpj' in col.lower()]
         df_clean = self._clean_cnpj_columns(df_clean, cnpj_columns)
         
-        # 4. Clean currency columns
+        # 5. Clean currency columns
         currency_columns = [col for col in df_clean.columns if 'preco' in col.lower()]
         df_clean = self._clean_currency_columns(df_clean, currency_columns)
         
@@ -97,33 +152,47 @@ class SimpleStandardizationProcessor:
         
         return df_clean
     
-    def validate_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def validate_dataframe(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
-        Add validation flags and quality score to DataFrame.
+        Compute validation flags and quality score for a DataFrame.
+        
+        Every check runs on whole columns, so the cost is a few NumPy passes
+        per column instead of Python calls per row. The flags go into a
+        separate frame so the business data is left untouched.
         
         Args:
             df: Cleaned DataFrame
             
         Returns:
-            DataFrame with validation columns added
+            Tuple of (df unchanged, quality DataFrame with the validation
+            flags and quality_score, sharing df's index)
         """
         self.logger.info("Running validation and quality scoring...")
         
-        df_validated = df.copy()
+        # Resolve the columns each check looks at once, not per row
+        cnpj_columns = [col for col in df.columns if 'cnpj' in col.lower()]
+        price_columns = [col for col in df.columns if 'preco' in col.lower()]
+        required_columns = ([col for col in ['ano', 'uf'] if col in df.columns] +
+                            [col for col in df.columns if 'descricao' in col.lower()])
         
         # Add basic validation flags
-        df_validated['has_valid_cnpj'] = df_validated.apply(self._check_valid_cnpj, axis=1)
-        df_validated['has_valid_state'] = df_validated.apply(self._check_valid_state, axis=1)
-        df_validated['has_valid_year'] = df_validated.apply(self._check_valid_year, axis=1)
-        df_validated['has_positive_prices'] = df_validated.apply(self._check_positive_prices, axis=1)
+        quality_df = pd.DataFrame({
+            'has_valid_cnpj': self._check_valid_cnpj(df, cnpj_columns),
+            'has_valid_state': self._check_valid_state(df),
+            'has_valid_year': self._check_valid_year(df),
+            'has_positive_prices': self._check_positive_prices(df, price_columns),
+        }, index=df.index)
         
         # Calculate overall quality score (0-100)
-        df_validated['quality_score'] = df_validated.apply(self._calculate_quality_score, axis=1)
+        checks = np.column_stack(
+            [quality_df.to_numpy()] + [self._check_required_field(df[col]) for col in required_columns]
+        )
+        quality_df['quality_score'] = checks.mean(axis=1) * 100
         
-        avg_quality = df_validated['quality_score'].mean()
+        avg_quality = quality_df['quality_score'].mean()
         self.logger.info(f"Validation complete: {avg_quality:.1f}% average quality score")
         
-        return df_validated
+        return df, quality_df
     
     def standardize_file(self, input_path: Path, output_path: Path) -> Dict[str, Any]:
         """
@@ -144,16 +213,11 @@ class SimpleStandardizationProcessor:
         # Load, clean, validate
         df_raw = self.load_raw_csv(input_path)
         df_clean = self.clean_dataframe(df_raw)
-        df_validated = self.validate_dataframe(df_clean)
+        df_output, quality_df = self.validate_dataframe(df_clean)
         
-        # Remove validation columns for output (keep only business data)
-        business_columns = [col for col in df_validated.columns 
-                          if not col.startswith(('quality_', 'has_valid_'))]
-        df_output = df_validated[business_columns]
-        
-        # Save standardized file
+        # Save standardized file (validation flags live in quality_df, not in the output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        df_output.to_csv(output_path, index=False, encoding='utf-8', sep=',')
+        self._write_csv(df_output, output_path)
         
         processing_time = time.time() - start_time
         
@@ -164,8 +228,8 @@ class SimpleStandardizationProcessor:
             'rows_output': len(df_output),
             'columns_input': len(df_raw.columns),
             'columns_output': len(df_output.columns),
-            'average_quality_score': df_validated['quality_score'].mean(),
-            'high_quality_rows': len(df_validated[df_validated['quality_score'] >= 80]),
+            'average_quality_score': quality_df['quality_score'].mean(),
+            'high_quality_rows': int((quality_df['quality_score'] >= 80).sum()),
             'processing_time_seconds': processing_time,
             'input_file': str(input_path),
             'output_file': str(output_path)
@@ -175,64 +239,60 @@ class SimpleStandardizationProcessor:
         
         return report
     
-    # Helper methods for cleaning (simplified versions)
-    def _standardize_column_names(self, df):
-        """Convert column names to ASCII lowercase with underscores."""
-        char_map = {'ã': 'a', 'á': 'a', 'â': 'a', 'à': 'a', 'é': 'e', 'ê': 'e', 
-                   'í': 'i', 'ó': 'o', 'ô': 'o', 'õ': 'o', 'ú': 'u', 'ç': 'c'}
-        
-        new_columns = []
-        for col in df.columns:
-            clean_col = str(col).lower().strip()
-            for pt_char, ascii_char in char_map.items():
-                clean_col = clean_col.replace(pt_char, ascii_char)
-            # Replace non-alphanumeric with underscores
-            import re
-            clean_col = re.sub(r'[^\w]', '_', clean_col)
-            clean_col = re.sub(r'_+', '_', clean_col).strip('_')
-            new_columns.append(clean_col)
-        
-        df.columns = new_columns
-        return df
+    def standardize_files(self, pairs: List[Tuple[Path, Path]],
+                          max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Standardize several files in parallel worker processes.
+        
+        Each file is an independent, CPU-bound pipeline, so every worker
+        process runs standardize_file on its own DataFrame.
+        
+        Args:
+            pairs: (input_path, output_path) tuples
+            max_workers: Number of processes (default: CPU count)
+            
+        Returns:
+            Processing reports in the same order as pairs
+        """
+        if not pairs:
+            return []
+        
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+        if max_workers == 1:
+            return [self.standardize_file(input_path, output_path) for input_path, output_path in pairs]
+        
+        self.logger.info(f"Standardizing {len(pairs)} files with {max_workers} processes")
+        
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            jobs = [(self.config, input_path, output_path) for input_path, output_path in pairs]
+            return list(executor.map(_standardize_one, jobs))
     
+    # Helper methods for cleaning (simplified versions)
     def _clean_text_columns(self, df, text_columns):
         """Apply encoding fixes to text columns."""
         encoding_fixes = getattr(self.config, 'encoding_fixes', {})
+        if not encoding_fixes:
+            return df
+        
+        pattern = build_encoding_fix_pattern(encoding_fixes)
+        replace_match = lambda match: encoding_fixes[match.group(0)]
         
         for col in text_columns:
             if col in df.columns:
-                df[col] = df[col].apply(lambda x: self._fix_encoding(x, encoding_fixes))
+                # Only str cells are fixed; other values and the column dtype are kept
+                df[col] = replace_in_text_cells(df[col], pattern, replace_match)
         
         return df
     
-    def _fix_encoding(self, text, encoding_fixes):
-        """Fix encoding artifacts in text."""
-        if pd.isna(text) or not isinstance(text, str):
-            return text
-        
-        fixed_text = text
-        for corrupted, correct in encoding_fixes.items():
-            fixed_text = fixed_text.replace(corrupted, correct)
-        
-        return fixed_text
-    
     def _clean_cnpj_columns(self, df, cnpj_columns):
         """Standardize CNPJ format to 14 digits."""
         for col in cnpj_columns:
             if col in df.columns:
-                df[col] = df[col].apply(self._standardize_cnpj)
+                digits_only = df[col].astype('string').str.replace(NON_DIGIT_RE, '', regex=True)
+                df[col] = digits_only.where(digits_only.str.len() == 14, pd.NA)
         
         return df
     
-    def _standardize_cnpj(self, cnpj):
-        """Extract 14 digits from CNPJ."""
-        if pd.isna(cnpj) or not isinstance(cnpj, str):
-            return None
-        
-        import re
-        digits_only = re.sub(r'\D', '', cnpj)
-        return digits_only if len(digits_only) == 14 else None
-    
     def _clean_currency_columns(self, df, currency_columns):
         """Convert Brazilian currency to float."""
         for col in currency_columns:
@@ -246,9 +306,8 @@ class SimpleStandardizationProcessor:
         if pd.isna(value) or not isinstance(value, str):
             return None
         
-        import re
         # Remove currency symbols
-        clean_value = re.sub(r'[R$\s]', '', str(value))
+        clean_value = CURRENCY_SYMBOLS_RE.sub('', str(value))
         
         # Handle Brazilian decimal format (comma as decimal)
         if ',' in clean_value and '.' in clean_value:
@@ -269,88 +328,59 @@ class SimpleStandardizationProcessor:
         except ValueError:
             return None
     
-    # Validation helper methods
-    def _check_valid_cnpj(self, row):
-        """Check if row has at least one valid CNPJ."""
-        cnpj_fields = [col for col in row.index if 'cnpj' in col.lower()]
-        
-        for field in cnpj_fields:
-            if not pd.isna(row[field]) and self._validate_cnpj(str(row[field])):
-                return True
-        
-        return False
-    
-    def _validate_cnpj(self, cnpj):
-        """Validate CNPJ checksum."""
-        if not cnpj or len(cnpj) != 14 or not cnpj.isdigit() or len(set(cnpj)) == 1:
-            return False
-        
-        # Checksum validation
-        weights_1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_1 = sum(int(cnpj[i]) * weights_1[i] for i in range(12))
-        digit_1 = 0 if (sum_1 % 11) < 2 else 11 - (sum_1 % 11)
-        
-        if int(cnpj[12]) != digit_1:
-            return False
-        
-        weights_2 = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_2 = sum(int(cnpj[i]) * weights_2[i] for i in range(13))
-        digit_2 = 0 if (sum_2 % 11) < 2 else 11 - (sum_2 % 11)
+    # Validation helper methods (column-wise, return boolean arrays)
+    def _check_valid_cnpj(self, df: pd.DataFrame, cnpj_columns: List[str]) -> np.ndarray:
+        """Check if each row has at least one valid CNPJ."""
+        valid = np.zeros(len(df), dtype=bool)
+        for col in cnpj_columns:
+            valid |= validate_cnpj_array(df[col])
         
-        return int(cnpj[13]) == digit_2
+        return valid
     
-    def _check_valid_state(self, row):
+    def _check_valid_state(self, df: pd.DataFrame) -> np.ndarray:
         """Check if state code is valid."""
-        if 'uf' in row.index and not pd.isna(row['uf']):
-            valid_states = {'AC', 'AL', 'AP', 'AM', 'BA', 'CE', 'DF', 'ES', 'GO', 'MA',
-                           'MT', 'MS', 'MG', 'PA', 'PB', 'PR', 'PE', 'PI', 'RJ', 'RN',
-                           'RS', 'RO', 'RR', 'SC', 'SP', 'SE', 'TO'}
-            return str(row['uf']).upper().strip() in valid_states
+        if 'uf' not in df.columns:
+            return np.zeros(len(df), dtype=bool)
         
-        return False
+        states = df['uf'].astype('string').str.upper().str.strip()
+        return states.isin(VALID_STATES).to_numpy(dtype=bool)
     
-    def _check_valid_year(self, row):
+    def _check_valid_year(self, df: pd.DataFrame) -> np.ndarray:
         """Check if year is in valid range."""
-        if 'ano' in row.index and not pd.isna(row['ano']):
-            try:
-                year = int(row['ano'])
-                return 2010 <= year <= 2030
-            except (ValueError, TypeError):
-                return False
-        
-        return False
+        if 'ano' not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        
+        years = pd.to_numeric(df['ano'], errors='coerce')
+        return years.between(2010, 2030).to_numpy(dtype=bool)
     
-    def _check_positive_prices(self, row):
-        """Check if price fields are positive."""
-        price_fields = [col for col in row.index if 'preco' in col.lower()]
-        
-        for field in price_fields:
-            if not pd.isna(row[field]):
-                try:
-                    value = float(row[field])
-                    if value > 0:
-                        return True
-                except (ValueError, TypeError):
-                    continue
-        
-        return False
+    def _check_positive_prices(self, df: pd.DataFrame, price_columns: List[str]) -> np.ndarray:
+        """Check if any price field is positive."""
+        if not price_columns:
+            return np.zeros(len(df), dtype=bool)
+        
+        # Cleaned price columns are already float, only convert what is not
+        prices = df[price_columns]
+        non_numeric = [col for col in price_columns if not pd.api.types.is_numeric_dtype(prices[col])]
+        if non_numeric:
+            prices = prices.assign(**{col: pd.to_numeric(prices[col], errors='coerce') for col in non_numeric})
+        
+        return (prices > 0).any(axis=1).to_numpy(dtype=bool)
     
-    def _calculate_quality_score(self, row):
-        """Calculate quality score (0-100) for a row."""
-        checks = [
-            self._check_valid_cnpj(row),
-            self._check_valid_state(row),
-            self._check_valid_year(row),
-            self._check_positive_prices(row)
-        ]
-        
-        # Add required field checks
-        required_fields = ['ano', 'uf'] + [col for col in row.index if 'descricao' in col.lower()]
-        for field in required_fields:
-            if field in row.index:
-                checks.append(not pd.isna(row[field]) and str(row[field]).strip() != '')
-        
-        if not checks:
-            return 0
-        
-        return (sum(checks) / len(checks)) * 100
\ No newline at end of file
+    def _check_required_field(self, column: pd.Series) -> np.ndarray:
+        """Check that a required field is neither null nor blank."""
+        not_blank = column.astype('string').str.strip() != ''
+        return not_blank.fillna(False).to_numpy(dtype=bool)
+
+
+def _init_worker():
+    """Pool initializer: one thread per worker for numba and pyarrow, the pool already uses every core."""
+    limit_worker_threads()
+    if pa is not None:
+        pa.set_cpu_count(1)
+
+
+def _standardize_one(job: Tuple[Any, Path, Path]) -> Dict[str, Any]:
+    """Worker entry point: standardize one file with a processor built in this process."""
+    config, input_path, output_path = job
+    processor = SimpleStandardizationProcessor(config, get_standardization_logger())
+    return processor.standardize_file(input_path, output_path)
@@ -0,0 +1,79 @@
+"""
+File system helpers for Fair-Price Brazilian Health Data Pipeline
+
+Directory listing and CSV format detection shared by the exploration,
+standardization and consolidation modules.
+"""
+
+import codecs
+import csv
+import os
+from pathlib import Path
+from typing import List, Tuple, Union
+
+
+# Bytes read from the start of a CSV to detect its encoding and separator
+SNIFF_BYTES = 64 * 1024
+
+# Separators sniff_csv_format chooses from, and its fallback (the usual one in Brazilian exports)
+CSV_SEPARATORS = ';,\t|'
+DEFAULT_CSV_SEPARATOR = ';'
+
+
+def list_csv_files(directory: Union[str, Path]) -> List[Path]:
+    """
+    List the CSV files directly inside a directory
+
+    Uses a single os.scandir pass: names are matched on the directory entry
+    and file types come from readdir, so no file is stat'ed individually
+    (symlinks excepted).
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Paths of the '.csv' files in directory order, empty if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries if entry.name.endswith('.csv') and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def sniff_csv_format(csv_path: Union[str, Path]) -> Tuple[str, str]:
+    """
+    Detect encoding and separator from the first SNIFF_BYTES of a CSV
+
+    The sample is UTF-8 unless it fails to decode, then latin-1. The header
+    line decides the separator when one candidate clearly occurs most often
+    (values may contain decimal commas); otherwise csv.Sniffer looks at the
+    whole sample, falling back to DEFAULT_CSV_SEPARATOR.
+
+    Args:
+        csv_path: Path to CSV file
+
+    Returns:
+        Tuple of (encoding, separator)
+    """
+    with open(csv_path, 'rb') as f:
+        sample = f.read(SNIFF_BYTES)
+
+    # Incremental decoder tolerates a multi-byte character cut at the sample end
+    try:
+        text = codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        encoding = 'utf-8'
+    except UnicodeDecodeError:
+        text = sample.decode('latin-1')
+        encoding = 'latin-1'
+
+    header = text.split('\n', 1)[0]
+    counts = {sep: header.count(sep) for sep in CSV_SEPARATORS}
+    ranked = sorted(counts, key=counts.get, reverse=True)
+    if counts[ranked[0]] > counts[ranked[1]]:
+        return encoding, ranked[0]
+
+    try:
+        return encoding, csv.Sniffer().sniff(text, delimiters=CSV_SEPARATORS).delimiter
+    except csv.Error:
+        return encoding, DEFAULT_CSV_SEPARATOR
@@ -5,12 +5,97 @@ Provides centralized logging setup with professional formatting,
 file output, and different levels for development and production use.
 """
 
+import atexit
+import functools
+import importlib.util
 import logging
+import os
+import queue
 import sys
+import time
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import util as multiprocessing_util
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
 from datetime import datetime
 
+try:
+    from tqdm import tqdm
+except ImportError:  # Optional: log_progress only logs, without a terminal progress bar
+    tqdm = None
+
+
+# Shared formatter with timestamp and module info
+LOG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Log files are written through a 1MB buffer, in writes of up to LOG_FLUSH_BYTES
+LOG_BUFFER_SIZE = 1 << 20
+LOG_FLUSH_BYTES = 64 * 1024
+
+
+class BufferedFileHandler(logging.StreamHandler):
+    """
+    File handler that batches records in a large write buffer
+    
+    A stock FileHandler writes and flushes every record. Here records
+    accumulate in the buffer and reach the file once LOG_FLUSH_BYTES are
+    pending, on WARNING and above, or when the owning BatchingQueueListener
+    runs out of queued records. logging.shutdown() flushes and closes the
+    handler at interpreter exit.
+    """
+    
+    def __init__(self, filename: str, encoding: str = 'utf-8',
+                 buffer_size: int = LOG_BUFFER_SIZE, flush_bytes: int = LOG_FLUSH_BYTES):
+        super().__init__(open(filename, 'ab', buffering=buffer_size))
+        self.encoding = encoding
+        self.flush_bytes = flush_bytes
+        self.pending = 0
+        _BUFFERED_HANDLERS.add(self)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            self.stream.write(data)
+            self.pending += len(data)
+            if self.pending >= self.flush_bytes or record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        with self.lock:
+            if not self.stream.closed:
+                self.stream.flush()
+            self.pending = 0
+    
+    def close(self):
+        with self.lock:
+            try:
+                if not self.stream.closed:
+                    self.stream.flush()
+                    self.stream.close()
+            finally:
+                super().close()
+
+
+# Forked workers would otherwise inherit unflushed records and write them again
+_BUFFERED_HANDLERS = weakref.WeakSet()
+
+
+def _flush_buffered_handlers():
+    for handler in list(_BUFFERED_HANDLERS):
+        handler.flush()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_flush_buffered_handlers)
+
 
 def setup_logger(
     name: str, 
@@ -33,22 +118,23 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
+    # Records stop at this logger instead of also reaching root handlers
+    # (e.g. logging.basicConfig); with propagation off, hasHandlers() only
+    # looks at this logger
+    logger.propagate = False
+    
     # Prevent duplicate handlers if logger already exists
-    if logger.handlers:
+    if logger.hasHandlers():
         return logger
     
-    # Create formatter with timestamp and module info
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    handlers = []
     
     # Console handler for immediate feedback
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(LOG_FORMATTER)
+        handlers.append(console_handler)
     
     # File handler for persistent logging
     if log_file:
@@ -56,14 +142,83 @@ def setup_logger(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = BufferedFileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(LOG_FORMATTER)
+        handlers.append(file_handler)
+    
+    # Handlers run on a background listener thread; callers only enqueue records
+    if handlers:
+        queue_handler = QueueHandler(queue.SimpleQueue())
+        _start_listener(queue_handler, handlers)
+        logger.addHandler(queue_handler)
+    else:
+        # Nothing configured here, so ancestors keep handling the records
+        logger.propagate = True
     
     return logger
 
 
+class BatchingQueueListener(QueueListener):
+    """
+    Queue listener that flushes its handlers whenever the queue runs dry
+    
+    Under load, records keep arriving and the buffered file handler writes
+    them in large batches; once the backlog is drained everything is flushed,
+    so an idle pipeline never holds log lines back.
+    """
+    
+    def handle(self, record: logging.LogRecord):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+# (queue handler, listener) pairs, one per configured logger
+_QUEUE_LISTENERS = []
+
+
+def _start_listener(queue_handler: QueueHandler, handlers: list):
+    """Start a listener thread draining queue_handler's queue into handlers."""
+    listener = BatchingQueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _QUEUE_LISTENERS.append((queue_handler, listener))
+
+
+def _stop_listeners():
+    """Drain and stop every listener; runs before logging.shutdown closes the handlers."""
+    for _, listener in _QUEUE_LISTENERS:
+        listener.stop()
+    _QUEUE_LISTENERS.clear()
+
+
+def _restart_listeners_in_child():
+    """Forked children have no listener threads: give each logger a fresh queue and thread."""
+    pairs = list(_QUEUE_LISTENERS)
+    _QUEUE_LISTENERS.clear()
+    for queue_handler, listener in pairs:
+        queue_handler.queue = queue.SimpleQueue()
+        _start_listener(queue_handler, listener.handlers)
+
+
+def _shutdown_worker_logging():
+    """Drain listeners and flush log files in a worker process about to exit."""
+    _stop_listeners()
+    _flush_buffered_handlers()
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listeners_in_child)
+
+# multiprocessing workers leave through os._exit, skipping atexit and logging.shutdown
+multiprocessing_util.register_after_fork(
+    _shutdown_worker_logging,
+    lambda shutdown: multiprocessing_util.Finalize(None, shutdown, exitpriority=0)
+)
+
+
 def get_default_log_file(module_name: str) -> str:
     """
     Generate default log file path based on module name and timestamp
@@ -74,13 +229,21 @@ def get_default_log_file(module_name: str) -> str:
     Returns:
         Log file path string
     """
+    global _LOG_DIR_READY
+    
     timestamp = datetime.now().strftime("%Y%m%d")
     log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    if not _LOG_DIR_READY:
+        log_dir.mkdir(exist_ok=True)
+        _LOG_DIR_READY = True
     
     return str(log_dir / f"{module_name}_{timestamp}.log")
 
 
+# Set once get_default_log_file has created the logs directory
+_LOG_DIR_READY = False
+
+
 def log_execution_time(logger: logging.Logger):
     """
     Decorator to log execution time of functions
@@ -94,78 +257,196 @@ def log_execution_time(logger: logging.Logger):
             pass
     """
     def decorator(func):
+        # Bound once here instead of looked up on every call
+        name = func.__name__
+        info = logger.info
+        error = logger.error
+        is_enabled_for = logger.isEnabledFor
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = datetime.now()
-            logger.info(f"Starting {func.__name__}")
+            # INFO lines are skipped entirely when the logger would drop them
+            enabled = is_enabled_for(logging.INFO)
+            if enabled:
+                info("Starting %s", name)
+            start_time = time.perf_counter()
             
             try:
                 result = func(*args, **kwargs)
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.info(f"Completed {func.__name__} in {duration:.2f} seconds")
+                if enabled:
+                    duration = time.perf_counter() - start_time
+                    info("Completed %s in %.2f seconds", name, duration)
                 return result
                 
             except Exception as e:
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.error(f"Failed {func.__name__} after {duration:.2f} seconds: {str(e)}")
+                duration = time.perf_counter() - start_time
+                error("Failed %s after %.2f seconds: %s", name, duration, e)
                 raise
                 
         return wrapper
     return decorator
 
 
-def log_data_operation(logger: logging.Logger, operation: str):
+# Completion details logged by log_data_operation, keyed by exact result type
+_SUMMARY = {
+    dict: lambda result: f"{len(result)} items",
+    list: lambda result: f"{len(result)} items",
+    tuple: lambda result: f"{len(result)} items",
+}
+
+
+def _find_summary(result_type: type) -> Optional[Callable]:
+    """Look up the completion detail for a result type, registering DataFrame on first need"""
+    summarize = _SUMMARY.get(result_type)
+    if summarize is None:
+        # A DataFrame result means pandas is loaded already; the logger never imports it
+        pandas = sys.modules.get('pandas')
+        if pandas is not None and pandas.DataFrame not in _SUMMARY:
+            _SUMMARY[pandas.DataFrame] = lambda result: f"{result.shape[0]:,} rows × {result.shape[1]} columns"
+            summarize = _SUMMARY.get(result_type)
+    return summarize
+
+
+@functools.lru_cache(maxsize=None)
+def _njit_compiled(func: Callable, signature, cache: bool) -> Callable:
+    """Compile func with numba once per (func, signature, cache)"""
+    from numba import njit
+    
+    if signature is None:
+        return njit(cache=cache)(func)
+    return njit(signature, cache=cache)(func)
+
+
+def log_execution_time_njit(logger: logging.Logger, signature=None, cache: bool = True):
+    """
+    Decorator to compile a numeric function with numba and log its execution time
+    
+    The function is compiled first and the timing wrapper goes around the
+    compiled dispatcher, so the logging I/O stays out of the jitted code.
+    numba is only imported when this decorator is used, so importing the
+    logger stays cheap; without numba installed this is plain
+    log_execution_time.
+    
+    Args:
+        logger: Logger instance to use for timing logs
+        signature: Optional numba signature (e.g. "float64(float64[:])") to
+            compile eagerly at decoration time instead of on the first call
+        cache: Persist the compiled machine code next to the module so later
+            runs skip recompilation
+        
+    Usage:
+        @log_execution_time_njit(logger, "float64(float64[:])")
+        def total(values):
+            return values.sum()
+    """
+    timed = log_execution_time(logger)
+    if importlib.util.find_spec('numba') is None:  # Optional: time the plain Python function
+        return timed
+    
+    def decorator(func):
+        return timed(_njit_compiled(func, signature, cache))
+    return decorator
+
+
+def log_data_operation(logger: Union[logging.Logger, Callable[[], logging.Logger]], operation: str):
     """
     Decorator to log data operations with input/output information
     
     Args:
-        logger: Logger instance to use
+        logger: Logger instance to use, or a callable returning it; a callable
+            is only resolved on the first call of the decorated function, so
+            decorating at import time does not create loggers or log files
         operation: Description of the operation being performed
         
     Usage:
-        @log_data_operation(logger, "CSV extraction")
+        @log_data_operation(get_extraction_logger, "CSV extraction")
         def extract_csv(year):
             return data
     """
     def decorator(func):
+        # Bound methods of the resolved logger, filled in on the first call
+        info = error = is_enabled_for = None
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger.info(f"🚀 Starting {operation}")
-            start_time = datetime.now()
+            nonlocal info, error, is_enabled_for
+            if info is None:
+                active_logger = logger() if callable(logger) else logger
+                info = active_logger.info
+                error = active_logger.error
+                is_enabled_for = active_logger.isEnabledFor
+            # INFO lines and the result summary are skipped when the logger would drop them
+            enabled = is_enabled_for(logging.INFO)
+            if enabled:
+                info("🚀 Starting %s", operation)
+            start_time = time.perf_counter()
             
             try:
                 result = func(*args, **kwargs)
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
+                if not enabled:
+                    return result
+                
+                duration = time.perf_counter() - start_time
                 
                 # Log result information if it's a data structure
-                if hasattr(result, '__len__'):
-                    try:
-                        if hasattr(result, 'shape'):  # DataFrame
-                            logger.info(f"✅ {operation} completed: {result.shape[0]:,} rows × {result.shape[1]} columns ({duration:.2f}s)")
-                        elif isinstance(result, dict):  # Dictionary result
-                            logger.info(f"✅ {operation} completed: {len(result)} items ({duration:.2f}s)")
-                        elif isinstance(result, (list, tuple)):  # List/tuple result
-                            logger.info(f"✅ {operation} completed: {len(result)} items ({duration:.2f}s)")
-                        else:
-                            logger.info(f"✅ {operation} completed ({duration:.2f}s)")
-                    except:
-                        logger.info(f"✅ {operation} completed ({duration:.2f}s)")
+                summarize = _find_summary(type(result))
+                if summarize is not None:
+                    info("✅ %s completed: %s (%.2fs)", operation, summarize(result), duration)
                 else:
-                    logger.info(f"✅ {operation} completed ({duration:.2f}s)")
+                    info("✅ %s completed (%.2fs)", operation, duration)
                 
                 return result
                 
             except Exception as e:
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.error(f"❌ {operation} failed after {duration:.2f}s: {str(e)}")
+                duration = time.perf_counter() - start_time
+                error("❌ %s failed after %.2fs: %s", operation, duration, e)
                 raise
                 
         return wrapper
     return decorator
 
 
+class _ProgressLogger:
+    """Progress reporter returned by log_progress"""
+    
+    __slots__ = ('logger', 'total', 'description', 'start_time', 'bar', 'stride', 'next_report')
+    
+    def __init__(self, logger, total, description):
+        self.logger = logger
+        self.total = total
+        self.description = description
+        self.start_time = time.perf_counter()
+        self.bar = None
+        
+        # Report every 10%; the next report point replaces a modulo per call
+        self.stride = max(1, total // 10)
+        self.next_report = self.stride
+        
+    def __enter__(self):
+        self.logger.info("📊 %s: 0/%d items", self.description, self.total)
+        if tqdm is not None and sys.stderr.isatty():
+            self.bar = tqdm(total=self.total, desc=self.description, mininterval=0.5, leave=False)
+        return self
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.bar is not None:
+            self.bar.close()
+        if exc_type is None:
+            duration = time.perf_counter() - self.start_time
+            self.logger.info("🎯 %s completed: %d/%d items (%.2fs)",
+                             self.description, self.total, self.total, duration)
+        
+    def __call__(self, current: int):
+        if self.bar is not None:
+            self.bar.update(current - self.bar.n)
+        if current >= self.next_report or current == self.total:
+            self.next_report = (current // self.stride + 1) * self.stride
+            percent = (current / self.total) * 100
+            elapsed = time.perf_counter() - self.start_time
+            self.logger.info("📈 %s: %d/%d items (%.1f%%) - %.1fs elapsed",
+                             self.description, current, self.total, percent, elapsed)
+
+
 def log_progress(logger: logging.Logger, total: int, description: str = "Processing"):
     """
     Context manager for logging progress of iterative operations
@@ -175,38 +456,21 @@ def log_progress(logger: logging.Logger, total: int, description: str = "Process
         total: Total number of items to process
         description: Description of what's being processed
         
+    Progress is logged every 10% whether or not tqdm is installed; with
+    tqdm and an interactive terminal, an in-place bar (redrawn at most every
+    0.5s) is drawn on stderr as well.
+    
     Usage:
         with log_progress(logger, len(files), "Processing CSV files") as progress:
             for i, file in enumerate(files):
                 # do work
                 progress(i + 1)
     """
-    class ProgressLogger:
-        def __init__(self, logger, total, description):
-            self.logger = logger
-            self.total = total
-            self.description = description
-            self.start_time = datetime.now()
-            
-        def __enter__(self):
-            self.logger.info(f"📊 {self.description}: 0/{self.total} items")
-            return self
-            
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            if exc_type is None:
-                duration = (datetime.now() - self.start_time).total_seconds()
-                self.logger.info(f"🎯 {self.description} completed: {self.total}/{self.total} items ({duration:.2f}s)")
-            
-        def __call__(self, current: int):
-            if current % max(1, self.total // 10) == 0 or current == self.total:
-                percent = (current / self.total) * 100
-                elapsed = (datetime.now() - self.start_time).total_seconds()
-                self.logger.info(f"📈 {self.description}: {current}/{self.total} items ({percent:.1f}%) - {elapsed:.1f}s elapsed")
-    
-    return ProgressLogger(logger, total, description)
+    return _ProgressLogger(logger, total, description)
 
 
 # Module-level convenience functions
+@functools.lru_cache(maxsize=None)
 def get_extraction_logger() -> logging.Logger:
     """Get logger for extraction module"""
     return setup_logger(
@@ -216,6 +480,7 @@ def get_extraction_logger() -> logging.Logger:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_standardization_logger() -> logging.Logger:
     """Get logger for standardization module"""
     return setup_logger(
@@ -225,6 +490,7 @@ def get_standardization_logger() -> logging.Logger:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_exploration_logger() -> logging.Logger:
     """Get logger for exploration module"""
     return setup_logger(
@@ -234,6 +500,7 @@ def get_exploration_logger() -> logging.Logger:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_consolidation_logger() -> logging.Logger:
     """Get logger for consolidation module"""
     return setup_logger(
@@ -0,0 +1,171 @@
+"""
+Tests for ZIP extraction in the OpenDataSUS extractor
+
+Archives are built in memory with zipfile and fed to the extractor through
+a fake streaming response, so no network access is needed.
+"""
+
+import io
+import logging
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from extraction import extractors
+from extraction.extractors import OpenDataSUSExtractor
+
+
+CSV_PAYLOAD = b"ano;uf;preco\n" + b"".join(b"2024;SP;%d,50\n" % i for i in range(20000))
+
+
+class FakeResponse:
+    """Streaming response serving a fixed body in small chunks"""
+
+    def __init__(self, body: bytes, chunk_size: int = 4096):
+        self.body = body
+        self.chunk_size = chunk_size
+
+    def iter_content(self, chunk_size=None):
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start:start + self.chunk_size]
+
+
+class UnseekableBuffer(io.BytesIO):
+    """Write target that makes zipfile emit data descriptors"""
+
+    def seekable(self):
+        return False
+
+    def tell(self):
+        raise OSError("unseekable")
+
+
+def build_zip(entries, compression=zipfile.ZIP_DEFLATED, seekable=True, force_zip64=False) -> bytes:
+    """Build a ZIP archive from (name, data) pairs"""
+    buffer = io.BytesIO() if seekable else UnseekableBuffer()
+    with zipfile.ZipFile(buffer, "w", compression=compression) as zip_file:
+        for name, data in entries:
+            with zip_file.open(name, "w", force_zip64=force_zip64) as member:
+                member.write(data)
+    return buffer.getvalue()
+
+
+class TestExtractZipToCsv(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = OpenDataSUSExtractor.__new__(OpenDataSUSExtractor)
+        self.extractor.logger = logging.getLogger("tests.extraction")
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.output_path = Path(self.tmp_dir.name) / "bps_2024.csv"
+
+    def extract(self, body: bytes, chunk_size: int = 4096):
+        self.extractor._extract_zip_to_csv(FakeResponse(body, chunk_size), 2024, self.output_path)
+
+    def assert_no_leftovers(self):
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_streams_deflated_entry(self):
+        self.extract(build_zip([("2024.csv", CSV_PAYLOAD)]), chunk_size=7)
+
+        self.assertEqual(self.output_path.read_bytes(), CSV_PAYLOAD)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [self.output_path.name])
+
+    def test_streams_stored_entry(self):
+        self.extract(build_zip([("2024.csv", CSV_PAYLOAD)], compression=zipfile.ZIP_STORED))
+
+        self.assertEqual(self.output_path.read_bytes(), CSV_PAYLOAD)
+
+    def test_streams_entry_with_data_descriptor(self):
+        body = build_zip([("2024.csv", CSV_PAYLOAD)], seekable=False)
+        self.assertTrue(body[6] & 0x8)  # general purpose flag: sizes follow the data
+
+        self.extract(body)
+
+        self.assertEqual(self.output_path.read_bytes(), CSV_PAYLOAD)
+
+    def test_streams_zip64_entry(self):
+        self.extract(build_zip([("2024.csv", CSV_PAYLOAD)], force_zip64=True))
+
+        self.assertEqual(self.output_path.read_bytes(), CSV_PAYLOAD)
+
+    def test_non_csv_first_entry_uses_buffered_fallback(self):
+        body = build_zip([("LEIAME.txt", b"readme"), ("2024.csv", CSV_PAYLOAD)])
+
+        self.extract(body)
+
+        self.assertEqual(self.output_path.read_bytes(), CSV_PAYLOAD)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [self.output_path.name])
+
+    def test_stored_entry_from_spooled_file(self):
+        # A tiny spool limit forces the archive to disk and the sendfile copy path
+        body = build_zip([("LEIAME.txt", b"readme"), ("2024.csv", CSV_PAYLOAD)],
+                         compression=zipfile.ZIP_STORED)
+
+        with mock.patch.object(extractors, "ZIP_SPOOL_MAX_SIZE", 1024):
+            self.extract(body)
+
+        self.assertEqual(self.output_path.read_bytes(), CSV_PAYLOAD)
+
+    def test_truncated_deflated_stream_leaves_no_file(self):
+        body = build_zip([("2024.csv", CSV_PAYLOAD)])
+
+        with self.assertRaisesRegex(Exception, "Truncated ZIP stream"):
+            self.extract(body[:len(body) // 2])
+
+        self.assert_no_leftovers()
+
+    def test_truncated_stored_stream_leaves_no_file(self):
+        body = build_zip([("2024.csv", CSV_PAYLOAD)], compression=zipfile.ZIP_STORED)
+
+        with self.assertRaisesRegex(Exception, "Truncated ZIP stream"):
+            self.extract(body[:len(body) // 2])
+
+        self.assert_no_leftovers()
+
+    def test_crc_mismatch_leaves_no_file(self):
+        body = bytearray(build_zip([("2024.csv", CSV_PAYLOAD)], compression=zipfile.ZIP_STORED))
+        body[body.index(b"2024;SP;100,50")] ^= 0x01
+
+        with self.assertRaisesRegex(Exception, "CRC mismatch"):
+            self.extract(bytes(body))
+
+        self.assert_no_leftovers()
+
+    def test_crc_mismatch_in_spooled_stored_entry_leaves_no_file(self):
+        body = bytearray(build_zip([("LEIAME.txt", b"readme"), ("2024.csv", CSV_PAYLOAD)],
+                                   compression=zipfile.ZIP_STORED))
+        body[body.index(b"2024;SP;100,50")] ^= 0x01
+
+        with mock.patch.object(extractors, "ZIP_SPOOL_MAX_SIZE", 1024):
+            with self.assertRaisesRegex(Exception, "CRC mismatch"):
+                self.extract(bytes(body))
+
+        self.assert_no_leftovers()
+
+    def test_failed_extraction_keeps_existing_csv(self):
+        self.output_path.write_bytes(b"previous download")
+        body = build_zip([("2024.csv", CSV_PAYLOAD)])
+
+        with self.assertRaises(Exception):
+            self.extract(body[:len(body) // 2])
+
+        self.assertEqual(self.output_path.read_bytes(), b"previous download")
+        self.assertEqual(os.listdir(self.tmp_dir.name), [self.output_path.name])
+
+    def test_archive_without_csv_leaves_no_file(self):
+        with self.assertRaisesRegex(Exception, "No CSV file found"):
+            self.extract(build_zip([("LEIAME.txt", b"readme")]))
+
+        self.assert_no_leftovers()
+
+
+if __name__ == "__main__":
+    unittest.main()